@@ -1,13 +1,34 @@
 """Protocol context for trading analysis."""
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional, List
 from datetime import datetime, timedelta
 from pathlib import Path
 import json
 
 
-@dataclass
+CONFIG_DIR = Path(__file__).parent / 'configs'
+
+
+@lru_cache(maxsize=32)
+def _load_config_json(path: str) -> dict:
+    """Parse a bundled static config once per process.
+
+    Callers must not mutate the returned dict; _dict_to_context copies the
+    lists it hands to the dataclasses.
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=1)
+def _bundled_config_names() -> frozenset:
+    """Names of the static configs shipped in CONFIG_DIR, listed once."""
+    return frozenset(p.stem for p in CONFIG_DIR.glob('*.json'))
+
+
+@dataclass(slots=True)
 class ProtocolHealth:
     """Protocol health snapshot."""
     protocol_id: str
@@ -72,7 +93,7 @@ class ProtocolHealth:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GovernanceEvent:
     """A governance event that might affect trading."""
     event_type: str                 # 'proposal_created', 'vote_started', 'vote_ended', 'execution'
@@ -97,7 +118,7 @@ class GovernanceEvent:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ProtocolContext:
     """Complete protocol context for a trading session."""
     health: ProtocolHealth
@@ -127,7 +148,7 @@ class ProtocolContext:
 
     def has_risk_flags(self) -> bool:
         """Check if protocol has any risk flags."""
-        return len(self.health.risk_flags) > 0
+        return bool(self.health.risk_flags)
 
 
 class ProtocolContextProvider:
@@ -293,19 +314,16 @@ class ProtocolContextProvider:
         analysis_end: Optional[datetime],
     ) -> Optional[ProtocolContext]:
         """Load from static configuration file."""
-        # Try protocol-specific config
-        config_file = Path(__file__).parent / 'configs' / f"{protocol_id}.json"
+        names = _bundled_config_names()
 
-        if not config_file.exists():
-            # Try default config
-            config_file = Path(__file__).parent / 'configs' / 'default.json'
+        # Try protocol-specific config, then the default one
+        name = protocol_id if protocol_id in names else 'default'
 
-        if not config_file.exists():
+        if name not in names:
             return None
 
         try:
-            with open(config_file) as f:
-                data = json.load(f)
+            data = _load_config_json(str(CONFIG_DIR / f"{name}.json"))
 
             context = self._dict_to_context(data)
 
@@ -342,7 +360,7 @@ class ProtocolContextProvider:
             active_proposals=health_data.get('governance', {}).get('active_proposals', 0),
             governance_participation=health_data.get('governance', {}).get('participation_rate', 0),
             recent_votes=health_data.get('governance', {}).get('recent_votes', 0),
-            risk_flags=health_data.get('risk', {}).get('flags', []),
+            risk_flags=list(health_data.get('risk', {}).get('flags', [])),
             risk_level=health_data.get('risk', {}).get('level', 'unknown'),
             fetched_at=health_data.get('metadata', {}).get('fetched_at', datetime.now().isoformat()),
             data_staleness_hours=health_data.get('metadata', {}).get('staleness_hours', 0),
@@ -365,7 +383,7 @@ class ProtocolContextProvider:
             recent_events=events,
             analysis_start=data.get('analysis_window', {}).get('start', ''),
             analysis_end=data.get('analysis_window', {}).get('end', ''),
-            warnings=data.get('warnings', []),
+            warnings=list(data.get('warnings', [])),
         )
 
     def _score_to_tier(self, score: float) -> str:
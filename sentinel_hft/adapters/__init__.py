@@ -5,6 +5,7 @@ Adapters decode raw trace bytes into StandardTrace objects.
 Each adapter handles a specific trace format version.
 """
 
+import os
 from pathlib import Path
 from typing import Optional, Tuple, Union
 
@@ -37,15 +38,21 @@ def auto_detect(path: Union[Path, str]) -> Tuple[TraceAdapter, Optional[FileHead
     """
     path = Path(path)
 
-    if not path.exists():
-        raise ValueError(f"File not found: {path}")
-
     # CSV by extension
     if path.suffix.lower() == '.csv':
+        if not path.exists():
+            raise ValueError(f"File not found: {path}")
         return CSVAdapter(), None
 
-    # Try to read file header
-    header = FileHeader.probe(path)
+    # One open yields both the header bytes and the file size
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(HEADER_SIZE)
+            file_size = os.fstat(f.fileno()).st_size
+    except FileNotFoundError:
+        raise ValueError(f"File not found: {path}") from None
+
+    header = FileHeader.probe_bytes(head)
 
     if header:
         # Modern format with header
@@ -64,7 +71,6 @@ def auto_detect(path: Union[Path, str]) -> Tuple[TraceAdapter, Optional[FileHead
             )
 
     # Legacy v1.0 format (no header, 32-byte records)
-    file_size = path.stat().st_size
     if file_size > 0 and file_size % 32 == 0:
         return SentinelV10Adapter(), None
 
@@ -11,7 +11,7 @@ from pathlib import Path
 from typing import Iterator, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class StandardTrace:
     """
     Normalized trace format used internally.
@@ -9,9 +9,55 @@ CRITICAL: The struct formats must be exactly correct or traces will be garbage.
 """
 
 import struct
+from dataclasses import fields
+from typing import Sequence, Union
+
+import numpy as np
+
 from .base import TraceAdapter, StandardTrace
 
 
+# Compiled once; '<QQQHHI' and '<BBHIQQQHH' + 12 reserved bytes (see adapters below)
+V10_STRUCT = struct.Struct('<QQQHHI')
+V11_STRUCT = struct.Struct('<BBHIQQQHH12x')
+
+# Structured dtypes mirroring the struct layouts below, for bulk encode/decode
+V10_DTYPE = np.dtype([
+    ('t_ingress', '<u8'),
+    ('t_egress', '<u8'),
+    ('data', '<u8'),
+    ('flags', '<u2'),
+    ('tx_id', '<u2'),
+    ('pad', '<u4'),
+])
+
+V11_DTYPE = np.dtype([
+    ('version', 'u1'),
+    ('record_type', 'u1'),
+    ('core_id', '<u2'),
+    ('seq_no', '<u4'),
+    ('t_ingress', '<u8'),
+    ('t_egress', '<u8'),
+    ('data', '<u8'),
+    ('flags', '<u2'),
+    ('tx_id', '<u2'),
+    ('reserved', 'V12'),
+])
+
+_TRACE_FIELDS = frozenset(f.name for f in fields(StandardTrace))
+
+
+def _pack_records(traces: Sequence[StandardTrace], dtype: np.dtype) -> bytes:
+    """Pack traces column by column into a zeroed record array."""
+    records = np.zeros(len(traces), dtype=dtype)
+    for name in dtype.names:
+        if name in _TRACE_FIELDS:
+            records[name] = np.fromiter(
+                (getattr(t, name) for t in traces), dtype=dtype[name], count=len(traces)
+            )
+    return records.tobytes()
+
+
 class SentinelV10Adapter(TraceAdapter):
     """
     Adapter for legacy v1.0 32-byte format.
@@ -48,9 +94,7 @@ class SentinelV10Adapter(TraceAdapter):
         if len(raw) < self.SIZE:
             raise ValueError(f"Buffer too small: {len(raw)} < {self.SIZE}")
 
-        t_ingress, t_egress, data, flags, tx_id, _pad = struct.unpack(
-            self.FORMAT, raw[:self.SIZE]
-        )
+        t_ingress, t_egress, data, flags, tx_id, _pad = V10_STRUCT.unpack_from(raw)
 
         return StandardTrace(
             version=0,
@@ -67,8 +111,7 @@ class SentinelV10Adapter(TraceAdapter):
     @staticmethod
     def encode(trace: StandardTrace) -> bytes:
         """Encode a trace to v1.0 format."""
-        return struct.pack(
-            SentinelV10Adapter.FORMAT,
+        return V10_STRUCT.pack(
             trace.t_ingress,
             trace.t_egress,
             trace.data,
@@ -77,6 +120,32 @@ class SentinelV10Adapter(TraceAdapter):
             0,  # padding
         )
 
+    @staticmethod
+    def encode_into(trace: StandardTrace, buf: Union[bytearray, memoryview], offset: int = 0) -> None:
+        """Encode a trace to v1.0 format in place at buf[offset:offset + 32]."""
+        V10_STRUCT.pack_into(
+            buf, offset,
+            trace.t_ingress,
+            trace.t_egress,
+            trace.data,
+            trace.flags,
+            trace.tx_id,
+            0,  # padding
+        )
+
+    @staticmethod
+    def encode_many(traces: Sequence[StandardTrace]) -> bytes:
+        """Encode a batch of traces to contiguous v1.0 records."""
+        return _pack_records(traces, V10_DTYPE)
+
+    def decode_many(self, raw: Union[bytes, memoryview]) -> np.ndarray:
+        """
+        View whole v1.0 records in a buffer as a structured array.
+
+        No copy is made; trailing partial records are ignored.
+        """
+        return np.frombuffer(raw, dtype=V10_DTYPE, count=len(raw) // self.SIZE)
+
 
 class SentinelV11Adapter(TraceAdapter):
     """
@@ -132,7 +201,7 @@ class SentinelV11Adapter(TraceAdapter):
             data,
             flags,
             tx_id,
-        ) = struct.unpack(self.DECODE_FORMAT, raw[:self.DECODE_SIZE])
+        ) = V11_STRUCT.unpack_from(raw)
 
         return StandardTrace(
             version=version,
@@ -148,9 +217,8 @@ class SentinelV11Adapter(TraceAdapter):
 
     @staticmethod
     def encode(trace: StandardTrace) -> bytes:
-        """Encode a trace to v1.1 format."""
-        packed = struct.pack(
-            SentinelV11Adapter.DECODE_FORMAT,
+        """Encode a trace to v1.1 format (reserved bytes zeroed)."""
+        return V11_STRUCT.pack(
             trace.version,
             trace.record_type,
             trace.core_id,
@@ -161,8 +229,35 @@ class SentinelV11Adapter(TraceAdapter):
             trace.flags,
             trace.tx_id,
         )
-        # Add 12 bytes of padding for reserved field
-        return packed + b'\x00' * 12
+
+    @staticmethod
+    def encode_into(trace: StandardTrace, buf: Union[bytearray, memoryview], offset: int = 0) -> None:
+        """Encode a trace to v1.1 format in place at buf[offset:offset + 48]."""
+        V11_STRUCT.pack_into(
+            buf, offset,
+            trace.version,
+            trace.record_type,
+            trace.core_id,
+            trace.seq_no,
+            trace.t_ingress,
+            trace.t_egress,
+            trace.data,
+            trace.flags,
+            trace.tx_id,
+        )
+
+    @staticmethod
+    def encode_many(traces: Sequence[StandardTrace]) -> bytes:
+        """Encode a batch of traces to contiguous v1.1 records."""
+        return _pack_records(traces, V11_DTYPE)
+
+    def decode_many(self, raw: Union[bytes, memoryview]) -> np.ndarray:
+        """
+        View whole v1.1 records in a buffer as a structured array.
+
+        No copy is made; trailing partial records are ignored.
+        """
+        return np.frombuffer(raw, dtype=V11_DTYPE, count=len(raw) // self.SIZE)
 
 
 # Verify struct sizes at module load
@@ -170,3 +265,11 @@ assert struct.calcsize(SentinelV10Adapter.FORMAT) == SentinelV10Adapter.SIZE, \
     "v1.0 adapter format verification failed"
 assert struct.calcsize(SentinelV11Adapter.DECODE_FORMAT) == SentinelV11Adapter.DECODE_SIZE, \
     "v1.1 adapter format verification failed"
+assert V10_STRUCT.size == SentinelV10Adapter.SIZE, \
+    "v1.0 compiled struct verification failed"
+assert V11_STRUCT.size == SentinelV11Adapter.SIZE, \
+    "v1.1 compiled struct verification failed"
+assert V10_DTYPE.itemsize == SentinelV10Adapter.SIZE, \
+    "v1.0 record dtype verification failed"
+assert V11_DTYPE.itemsize == SentinelV11Adapter.SIZE, \
+    "v1.1 record dtype verification failed"
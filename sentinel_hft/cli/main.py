@@ -28,6 +28,7 @@ except ImportError:
 from ..config import SentinelConfig, load_config, generate_default_config
 from ..formats.reader import TraceReader
 from ..streaming.analyzer import StreamingMetrics, StreamingConfig
+from ..core import jsonio
 from ..core.report import AnalysisReport, ReportStatus
 from ..core.evidence import EvidenceBundle, TraceEvidence
 
@@ -231,8 +232,8 @@ if HAS_RICH:
         Pro Feature: Add --slack-webhook to get alerts on regressions.
         """
         try:
-            current_data = json.loads(current.read_text())
-            baseline_data = json.loads(baseline.read_text())
+            current_data = jsonio.loads(current.read_bytes())
+            baseline_data = jsonio.loads(baseline.read_bytes())
         except Exception as e:
             console.print(f"[red]Error loading metrics:[/] {e}")
             raise typer.Exit(1)
@@ -326,7 +327,7 @@ if HAS_RICH:
             reasons.append(f"{current_drops} traces dropped")
 
         if output:
-            output.write_text(json.dumps(diff, indent=2))
+            output.write_text(jsonio.dumps(diff, indent=2))
 
         # Send Slack alert on regression (Pro feature)
         if failed and slack_webhook:
@@ -393,24 +394,26 @@ if HAS_RICH:
         streaming_config = StreamingConfig(clock_hz=cfg.clock.frequency_hz)
         metrics = StreamingMetrics(streaming_config)
 
-        def on_traces(traces):
-            for trace in traces:
-                metrics.add(trace)
-            if prom and metrics.tx_count % 10000 == 0:
-                prom.update_from_snapshot(metrics.snapshot())
-
         if udp_port:
             console.print(f"[blue]UDP port:[/] {udp_port}")
             try:
-                from ..collectors.udp_collector import UDPCollector
-                collector = UDPCollector(port=udp_port)
+                from ..collectors import SPSCRing, UDPCollector
+                # Receive thread produces record batches; this thread analyzes
+                ring = SPSCRing(4096)
+                collector = UDPCollector(port=udp_port, on_records=ring.offer)
                 collector.start()
                 console.print("[green]Listening for UDP traces...[/]")
                 try:
+                    next_export = time.monotonic() + 1.0
                     while True:
-                        time.sleep(1)
-                        if prom:
+                        batches = ring.drain()
+                        for records in batches:
+                            metrics.add_batch(records)
+                        if not batches:
+                            time.sleep(0.001)
+                        if prom and time.monotonic() >= next_export:
                             prom.update_from_snapshot(metrics.snapshot())
+                            next_export = time.monotonic() + 1.0
                 except KeyboardInterrupt:
                     collector.stop()
                     console.print("\n[yellow]Stopped[/]")
@@ -1,5 +1,6 @@
 """Collectors for receiving traces from various sources."""
 
+from .ring import SPSCRing
 from .udp_collector import UDPCollector, UDPPacketHeader
 
-__all__ = ['UDPCollector', 'UDPPacketHeader']
+__all__ = ['SPSCRing', 'UDPCollector', 'UDPPacketHeader']
@@ -0,0 +1,84 @@
+"""
+Single-producer / single-consumer ring buffer.
+
+Hands record batches from the UDP receive thread to the analyzer thread
+without a lock. The producer only writes ``_tail`` and the consumer only
+writes ``_head``; a slot is filled before ``_tail`` is advanced past it
+and cleared before ``_head`` is, and under the GIL each of those stores
+is atomic, so neither side ever sees a half-published slot.
+
+The ring is bounded: when the consumer falls behind, offer() rejects the
+item and counts it in ``dropped`` instead of growing without limit.
+"""
+
+from typing import Any, List, Optional
+
+
+class SPSCRing:
+    """
+    Bounded lock-free queue for exactly one producer and one consumer thread.
+
+    Capacity is rounded up to a power of two so slot indexing is a mask.
+
+    Example:
+        ring = SPSCRing(4096)
+        collector = UDPCollector(port=5000, on_records=ring.offer)
+        ...
+        for records in ring.drain():
+            metrics.add_batch(records)
+    """
+
+    def __init__(self, capacity: int = 4096):
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+
+        size = 1 << (capacity - 1).bit_length()
+        self._slots: List[Any] = [None] * size
+        self._mask = size - 1
+        self._head = 0  # next slot to read (consumer-owned)
+        self._tail = 0  # next slot to write (producer-owned)
+        self.dropped = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._mask + 1
+
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    def offer(self, item: Any) -> bool:
+        """Enqueue item (producer side). Returns False if the ring is full."""
+        tail = self._tail
+        if tail - self._head > self._mask:
+            self.dropped += 1
+            return False
+        self._slots[tail & self._mask] = item
+        self._tail = tail + 1
+        return True
+
+    def poll(self) -> Optional[Any]:
+        """Dequeue the oldest item (consumer side), or None if empty."""
+        head = self._head
+        if head == self._tail:
+            return None
+        idx = head & self._mask
+        item = self._slots[idx]
+        self._slots[idx] = None
+        self._head = head + 1
+        return item
+
+    def drain(self, max_items: Optional[int] = None) -> List[Any]:
+        """Dequeue everything currently published (up to max_items)."""
+        head = self._head
+        n = self._tail - head
+        if max_items is not None:
+            n = min(n, max_items)
+
+        mask = self._mask
+        slots = self._slots
+        items = []
+        for i in range(head, head + n):
+            items.append(slots[i & mask])
+            slots[i & mask] = None
+        self._head = head + n
+        return items
@@ -16,13 +16,19 @@ Packet format:
         N trace records (48 bytes each for v1.1)
 """
 
+import ctypes
+import errno
+import os
 import socket
 import struct
+import sys
 import zlib
 import threading
 import logging
 from dataclasses import dataclass
-from typing import Callable, Optional, List
+from typing import Callable, Optional, List, Union
+
+import numpy as np
 
 from ..adapters.base import StandardTrace
 from ..adapters.sentinel_adapter import SentinelV11Adapter
@@ -31,7 +37,7 @@ from ..streaming.sequence import SequenceTracker
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class UDPPacketHeader:
     """
     Header for UDP trace packets.
@@ -67,22 +73,12 @@ class UDPPacketHeader:
         if len(data) < cls.SIZE:
             raise ValueError(f"Header too small: {len(data)} < {cls.SIZE}")
 
-        values = struct.unpack(cls.FORMAT, data[:cls.SIZE])
-        return cls(
-            magic=values[0],
-            version=values[1],
-            core_id=values[2],
-            seq_start=values[3],
-            seq_end=values[4],
-            record_count=values[5],
-            reserved=values[6],
-            crc32=values[7],
-        )
+        # unpack_from reads the header in place; no slice of the datagram
+        return cls(*UDP_HEADER_STRUCT.unpack_from(data))
 
     def encode(self) -> bytes:
         """Encode header to bytes."""
-        return struct.pack(
-            self.FORMAT,
+        return UDP_HEADER_STRUCT.pack(
             self.magic,
             self.version,
             self.core_id,
@@ -98,19 +94,96 @@ class UDPPacketHeader:
         return self.magic == self.MAGIC
 
     @staticmethod
-    def compute_crc(payload: bytes) -> int:
+    def compute_crc(payload: Union[bytes, memoryview]) -> int:
         """Compute CRC32 for payload."""
         return zlib.crc32(payload) & 0xFFFFFFFF
 
-    def verify_payload(self, payload: bytes) -> bool:
+    def verify_payload(self, payload: Union[bytes, memoryview]) -> bool:
         """Verify CRC32 of payload matches header."""
         return self.compute_crc(payload) == self.crc32
 
 
+# Compiled once; decode/encode run per packet
+UDP_HEADER_STRUCT = struct.Struct(UDPPacketHeader.FORMAT)
+
 # Verify struct size at import
-_computed = struct.calcsize(UDPPacketHeader.FORMAT)
-assert _computed == UDPPacketHeader.SIZE, \
-    f"UDP header size mismatch: {_computed} != {UDPPacketHeader.SIZE}"
+assert UDP_HEADER_STRUCT.size == UDPPacketHeader.SIZE, \
+    f"UDP header size mismatch: {UDP_HEADER_STRUCT.size} != {UDPPacketHeader.SIZE}"
+
+
+# Datagrams drained per recvmmsg(2) call, and the per-datagram buffer
+# (the largest UDP payload, so no trace packet is ever truncated)
+RECV_BATCH = 32
+RECV_BUFSIZE = 65535
+
+_libc = None
+if sys.platform.startswith('linux'):
+    try:
+        _libc = ctypes.CDLL(None, use_errno=True)
+    except OSError:
+        _libc = None
+    if _libc is not None and not hasattr(_libc, 'recvmmsg'):
+        _libc = None
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [('iov_base', ctypes.c_void_p), ('iov_len', ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_name', ctypes.c_void_p),
+        ('msg_namelen', ctypes.c_uint32),
+        ('msg_iov', ctypes.POINTER(_IOVec)),
+        ('msg_iovlen', ctypes.c_size_t),
+        ('msg_control', ctypes.c_void_p),
+        ('msg_controllen', ctypes.c_size_t),
+        ('msg_flags', ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [('msg_hdr', _MsgHdr), ('msg_len', ctypes.c_uint)]
+
+
+class _BatchReceiver:
+    """
+    Drain queued datagrams with recvmmsg(2), many per syscall (Linux only).
+
+    Buffers and message headers are allocated once and reused; each
+    received datagram is copied out as bytes, since the buffers are
+    overwritten by the next call.
+    """
+
+    def __init__(self, vlen: int = RECV_BATCH, bufsize: int = RECV_BUFSIZE):
+        self.vlen = vlen
+        self.bufsize = bufsize
+        self._buf = (ctypes.c_char * (vlen * bufsize))()
+        self._view = memoryview(self._buf).cast('B')
+        self._iov = (_IOVec * vlen)()
+        self._msgs = (_MMsgHdr * vlen)()
+
+        base = ctypes.addressof(self._buf)
+        for i in range(vlen):
+            self._iov[i].iov_base = base + i * bufsize
+            self._iov[i].iov_len = bufsize
+            self._msgs[i].msg_hdr.msg_iov = ctypes.pointer(self._iov[i])
+            self._msgs[i].msg_hdr.msg_iovlen = 1
+
+    def recv(self, fd: int) -> List[bytes]:
+        """Return the datagrams already queued on fd (never blocks)."""
+        n = _libc.recvmmsg(fd, self._msgs, self.vlen, socket.MSG_DONTWAIT, None)
+        if n < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                return []
+            raise OSError(err, os.strerror(err))
+
+        size = self.bufsize
+        return [
+            bytes(self._view[i * size:i * size + self._msgs[i].msg_len])
+            for i in range(n)
+        ]
 
 
 class UDPCollector:
@@ -126,6 +199,10 @@ class UDPCollector:
         collector.start()
         # ... later ...
         collector.stop()
+
+    For throughput, pass on_records instead: it receives each packet's
+    records as a v1.1 structured array (e.g. StreamingMetrics.add_batch)
+    and no StandardTrace objects are built.
     """
 
     def __init__(
@@ -134,13 +211,16 @@ class UDPCollector:
         port: int = 5000,
         on_traces: Optional[Callable[[List[StandardTrace]], None]] = None,
         on_drop: Optional[Callable[[int, int, int], None]] = None,
+        on_records: Optional[Callable[[np.ndarray], None]] = None,
     ):
         self.host = host
         self.port = port
         self.on_traces = on_traces
         self.on_drop = on_drop
+        self.on_records = on_records
 
         self.socket: Optional[socket.socket] = None
+        self._batch: Optional[_BatchReceiver] = None
         self._running = False
         self._thread: Optional[threading.Thread] = None
 
@@ -162,6 +242,8 @@ class UDPCollector:
         self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.socket.bind((self.host, self.port))
         self.socket.settimeout(1.0)
+        if _libc is not None:
+            self._batch = _BatchReceiver()
 
         self._running = True
         self._thread = threading.Thread(target=self._receive_loop, daemon=True)
@@ -182,13 +264,29 @@ class UDPCollector:
         """Main receive loop."""
         while self._running:
             try:
-                data, addr = self.socket.recvfrom(65535)
+                # Block (with timeout) for the first datagram...
+                data, addr = self.socket.recvfrom(RECV_BUFSIZE)
                 self._handle_packet(data)
+                # ...then drain any backlog a batch per syscall
+                self._drain()
             except socket.timeout:
                 continue
             except Exception as e:
                 logger.error(f"Receive error: {e}")
 
+    def _drain(self) -> None:
+        """Handle queued datagrams via recvmmsg until the socket is empty."""
+        if self._batch is None:
+            return
+
+        fd = self.socket.fileno()
+        while True:
+            packets = self._batch.recv(fd)
+            for data in packets:
+                self._handle_packet(data)
+            if len(packets) < self._batch.vlen:
+                return
+
     def _handle_packet(self, data: bytes) -> None:
         """Handle a received UDP packet."""
         self.packets_received += 1
@@ -210,7 +308,8 @@ class UDPCollector:
             self.packets_invalid += 1
             return
 
-        payload = data[UDPPacketHeader.SIZE:]
+        # View, not copy: CRC and record decode both read straight from data
+        payload = memoryview(data)[UDPPacketHeader.SIZE:]
 
         if not header.verify_payload(payload):
             logger.warning("CRC mismatch")
@@ -224,14 +323,17 @@ class UDPCollector:
         if drop and self.on_drop:
             self.on_drop(header.core_id, drop.expected_seq, drop.actual_seq)
 
-        # Decode traces
-        traces = self._decode_traces(payload)
-        self.traces_received += len(traces)
+        # Zero-copy record view; StandardTrace objects only if asked for
+        records = self.adapter.decode_many(payload)
+        self.traces_received += len(records)
+
+        if self.on_records and len(records):
+            self.on_records(records)
 
-        if self.on_traces and traces:
-            self.on_traces(traces)
+        if self.on_traces and len(records):
+            self.on_traces(self._decode_traces(payload))
 
-    def _decode_traces(self, payload: bytes) -> List[StandardTrace]:
+    def _decode_traces(self, payload: Union[bytes, memoryview]) -> List[StandardTrace]:
         """Decode trace records from payload."""
         traces = []
         rec_size = self.adapter.record_size()
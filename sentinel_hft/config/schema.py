@@ -23,13 +23,18 @@ Example config (sentinel.yml):
 """
 
 import os
-import re
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, replace
 from typing import Optional, List, Any
 
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it; same result, faster parse
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 def _substitute_env_vars(value: Any) -> Any:
     """
@@ -39,16 +44,35 @@ def _substitute_env_vars(value: Any) -> Any:
         ${SLACK_WEBHOOK_URL} → os.environ.get('SLACK_WEBHOOK_URL')
     """
     if isinstance(value, str):
-        pattern = r'\$\{([^}]+)\}'
-
-        def replace(match):
-            var_name = match.group(1)
-            env_value = os.environ.get(var_name)
-            if env_value is None:
-                return match.group(0)  # Keep original if not found
-            return env_value
-
-        return re.sub(pattern, replace, value)
+        start = value.find('${')
+        if start < 0:
+            return value
+
+        # Jump between '${' sites with str.find; text in between is copied
+        # through as whole slices
+        parts = []
+        pos = 0
+        while start >= 0:
+            end = value.find('}', start + 2)
+            if end < 0:
+                break  # No closing brace left, so no later match either
+
+            var_name = value[start + 2:end]
+            if not var_name:
+                # '${}' is not a reference; keep scanning after '${'
+                parts.append(value[pos:start + 2])
+                pos = start + 2
+            else:
+                env_value = os.environ.get(var_name)
+                parts.append(value[pos:start])
+                # Keep original if not found
+                parts.append(value[start:end + 1] if env_value is None else env_value)
+                pos = end + 1
+
+            start = value.find('${', pos)
+
+        parts.append(value[pos:])
+        return ''.join(parts)
 
     elif isinstance(value, dict):
         return {k: _substitute_env_vars(v) for k, v in value.items()}
@@ -145,7 +169,7 @@ class SentinelConfig:
             raise FileNotFoundError(f"Config not found: {path}")
 
         with open(path) as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_YamlLoader) or {}
 
         data = _substitute_env_vars(data)
         return cls.from_dict(data)
@@ -194,12 +218,24 @@ class SentinelConfig:
         return errors
 
     def redacted(self) -> 'SentinelConfig':
-        """Return copy with secrets redacted."""
-        import copy
-        redacted = copy.deepcopy(self)
-        if redacted.exporters.slack.webhook:
-            redacted.exporters.slack.webhook = '***REDACTED***'
-        return redacted
+        """
+        Return copy with secrets redacted.
+
+        Only the sections holding a secret are rebuilt; the rest are shared
+        with this config, so treat the result as read-only (it is meant
+        for display and logging).
+        """
+        slack = self.exporters.slack
+        if not slack.webhook:
+            return replace(self)
+
+        return replace(
+            self,
+            exporters=replace(
+                self.exporters,
+                slack=replace(slack, webhook='***REDACTED***'),
+            ),
+        )
 
 
 def load_config(path: Optional[Path] = None) -> SentinelConfig:
@@ -5,13 +5,27 @@ Evidence provides the raw data to support analysis conclusions,
 enabling verification and debugging of reported issues.
 """
 
-import json
 import gzip
 import base64
 from dataclasses import dataclass, field, asdict
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 from datetime import datetime
 
+from . import jsonio
+
+_USE_ZSTD = False
+try:
+    import zstandard as _zstd
+    _USE_ZSTD = True
+except ImportError:
+    _zstd = None
+
+# zstd frame magic; from_compressed treats anything else as gzip
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# Default zstd level: faster than gzip at a similar or better ratio
+ZSTD_LEVEL = 3
+
 
 @dataclass
 class TraceEvidence:
@@ -157,11 +171,18 @@ class EvidenceBundle:
 
     def to_json(self, indent: int = 2) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+        return jsonio.dumps(self.to_dict(), indent=indent)
 
     def to_compressed(self) -> bytes:
-        """Compress evidence bundle for storage."""
+        """
+        Compress evidence bundle for storage.
+
+        Uses zstd when zstandard is installed (``pip install
+        sentinel-hft[zstd]``), otherwise gzip.
+        """
         json_bytes = self.to_json(indent=None).encode('utf-8')
+        if _USE_ZSTD:
+            return _zstd.ZstdCompressor(level=ZSTD_LEVEL).compress(json_bytes)
         return gzip.compress(json_bytes)
 
     def to_base64(self) -> str:
@@ -208,15 +229,25 @@ class EvidenceBundle:
         return bundle
 
     @classmethod
-    def from_json(cls, json_str: str) -> 'EvidenceBundle':
+    def from_json(cls, json_str: Union[str, bytes]) -> 'EvidenceBundle':
         """Create from JSON string."""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(jsonio.loads(json_str))
 
     @classmethod
     def from_compressed(cls, compressed: bytes) -> 'EvidenceBundle':
-        """Create from compressed bytes."""
-        json_bytes = gzip.decompress(compressed)
-        return cls.from_json(json_bytes.decode('utf-8'))
+        """Create from compressed bytes (zstd or gzip, by frame magic)."""
+        if compressed[:4] == ZSTD_MAGIC:
+            if _zstd is None:
+                raise ValueError(
+                    "Evidence bundle is zstd-compressed; "
+                    "install sentinel-hft[zstd] to read it"
+                )
+            json_bytes = _zstd.ZstdDecompressor().decompress(compressed)
+        else:
+            json_bytes = gzip.decompress(compressed)
+
+        # Both JSON backends parse UTF-8 bytes directly
+        return cls.from_json(json_bytes)
 
     @classmethod
     def from_base64(cls, b64_str: str) -> 'EvidenceBundle':
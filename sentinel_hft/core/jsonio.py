@@ -0,0 +1,39 @@
+"""
+JSON encode/decode helpers for report I/O.
+
+Uses orjson when installed (``pip install sentinel-hft[fastjson]``),
+otherwise falls back to the stdlib json module. Output is valid JSON
+either way; orjson only supports 2-space indentation, so other indent
+values always go through the stdlib encoder.
+"""
+
+import json
+from typing import Any, Optional, Union
+
+_USE_ORJSON = False
+try:
+    import orjson as _orjson
+    _USE_ORJSON = True
+except ImportError:
+    _orjson = None
+
+
+def dumps(obj: Any, indent: Optional[int] = None) -> str:
+    """Serialize obj to a JSON string."""
+    if _USE_ORJSON and indent in (None, 2):
+        option = _orjson.OPT_SERIALIZE_NUMPY | _orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= _orjson.OPT_INDENT_2
+        try:
+            return _orjson.dumps(obj, option=option).decode('utf-8')
+        except TypeError:
+            # Types orjson refuses (e.g. float subclasses); stdlib handles them
+            pass
+    return json.dumps(obj, indent=indent)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON document."""
+    if _USE_ORJSON:
+        return _orjson.loads(data)
+    return json.loads(data)
@@ -10,12 +10,12 @@ Reports are structured JSON documents containing:
 - Evidence bundle (optional, for debugging)
 """
 
-import json
 from dataclasses import dataclass, field, asdict
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
 
+from . import jsonio
 from .evidence import EvidenceBundle
 from .errors import SentinelError
 
@@ -241,9 +241,12 @@ class AnalysisReport:
 
     def populate_ns_values(self) -> None:
         """Populate nanosecond values from cycle counts."""
-        self.latency.mean_ns = self.cycles_to_ns(self.latency.mean_cycles)
-        self.latency.p99_ns = self.cycles_to_ns(self.latency.p99_cycles)
-        self.latency.p999_ns = self.cycles_to_ns(self.latency.p999_cycles)
+        # Same product as cycles_to_ns, with the period computed once
+        period_ns = 1000.0 / self.clock_frequency_mhz
+        latency = self.latency
+        latency.mean_ns = latency.mean_cycles * period_ns
+        latency.p99_ns = latency.p99_cycles * period_ns
+        latency.p999_ns = latency.p999_cycles * period_ns
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
@@ -275,7 +278,7 @@ class AnalysisReport:
 
     def to_json(self, indent: int = 2) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+        return jsonio.dumps(self.to_dict(), indent=indent)
 
     @classmethod
     def from_dict(cls, data: dict) -> 'AnalysisReport':
@@ -337,7 +340,7 @@ class AnalysisReport:
     @classmethod
     def from_json(cls, json_str: str) -> 'AnalysisReport':
         """Create from JSON string."""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(jsonio.loads(json_str))
 
     def summary(self) -> str:
         """Get human-readable summary."""
@@ -56,8 +56,7 @@ class FileHeader:
 
     def encode(self) -> bytes:
         """Encode header to bytes."""
-        return struct.pack(
-            self.FORMAT,
+        return HEADER_STRUCT.pack(
             self.magic,
             self.version,
             self.endianness,
@@ -73,9 +72,8 @@ class FileHeader:
         if len(data) < HEADER_SIZE:
             raise ValueError(f"Header too small: {len(data)} < {HEADER_SIZE}")
 
-        magic, version, endian, rec_size, clock, run_id, count = struct.unpack(
-            cls.FORMAT, data[:HEADER_SIZE]
-        )
+        fields = HEADER_STRUCT.unpack_from(data)
+        magic, version, endian, rec_size, clock, run_id, count = fields
 
         if magic != MAGIC:
             raise ValueError(f"Invalid magic: {magic!r} (expected {MAGIC!r})")
@@ -99,24 +97,29 @@ class FileHeader:
             FileHeader if file has valid header, None otherwise.
         """
         try:
-            path = Path(path)
-            if not path.exists():
-                return None
-            if path.stat().st_size < HEADER_SIZE:
-                return None
-
+            # One open+read; a missing file raises and a short read
+            # means the file is smaller than a header
             with open(path, 'rb') as f:
                 data = f.read(HEADER_SIZE)
 
-            # Check magic before full decode
-            if len(data) >= 4 and data[:4] == MAGIC:
-                return cls.decode(data)
-
-            return None
+            return cls.probe_bytes(data)
 
         except Exception:
             return None
 
+    @classmethod
+    def probe_bytes(cls, data: bytes) -> Optional['FileHeader']:
+        """
+        Try to decode a header from the first bytes of a file.
+
+        Returns:
+            FileHeader if data starts with a complete header, None otherwise.
+        """
+        # Check magic before full decode
+        if len(data) >= HEADER_SIZE and data[:4] == MAGIC:
+            return cls.decode(data)
+        return None
+
     def validate(self) -> List[str]:
         """
         Validate header fields.
@@ -141,7 +144,9 @@ class FileHeader:
         return errors
 
 
+# Compiled once; encode/decode run per file open
+HEADER_STRUCT = struct.Struct(FileHeader.FORMAT)
+
 # Verify struct size at module load
-_computed_size = struct.calcsize(FileHeader.FORMAT)
-assert _computed_size == HEADER_SIZE, \
-    f"FileHeader format size mismatch: {_computed_size} != {HEADER_SIZE}"
+assert HEADER_STRUCT.size == HEADER_SIZE, \
+    f"FileHeader format size mismatch: {HEADER_STRUCT.size} != {HEADER_SIZE}"
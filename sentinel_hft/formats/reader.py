@@ -4,17 +4,23 @@ TraceReader - High-level interface for reading trace files.
 TraceReader handles:
 - Format auto-detection
 - Header parsing and skipping
-- Streaming record iteration
+- Streaming record iteration over a read-only buffer (memory mapped
+  for large files)
 
 This is the primary interface for reading trace files. It ensures headers
 are properly skipped so records decode correctly.
 """
 
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+import numpy as np
 
 from .file_header import FileHeader, HEADER_SIZE
+from .record_types import RecordType
 from ..adapters.base import TraceAdapter, StandardTrace
 from ..adapters import auto_detect
 
@@ -53,6 +59,34 @@ class TraceFile:
         return self.adapter.record_size()
 
 
+# Below this size one read() is cheaper than setting up a mapping
+MMAP_THRESHOLD = 16 * 4096
+
+# Records converted to Python ints at a time by iter_tx_events
+ITER_CHUNK_RECORDS = 65536
+
+
+def _load_file(path: Path) -> Optional[Union[bytes, mmap.mmap]]:
+    """
+    Load a file read-only for a sequential scan; None if it is empty.
+
+    Small files are read into bytes, larger ones are memory mapped.
+    """
+    with open(path, 'rb') as f:
+        size = f.seek(0, 2)
+        if size == 0:
+            return None
+        if size < MMAP_THRESHOLD:
+            f.seek(0)
+            return f.read()
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # madvise is POSIX-only
+    if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+    return mm
+
+
 class TraceReader:
     """
     High-level interface for reading trace files.
@@ -88,11 +122,14 @@ class TraceReader:
         """
         path = Path(path)
 
-        if not path.exists():
-            raise FileNotFoundError(f"Trace file not found: {path}")
-
-        # Detect format and get adapter
-        adapter, header = auto_detect(path)
+        # Detect format and get adapter; auto_detect opens the file once for
+        # both header and size, so existence is only checked on failure
+        try:
+            adapter, header = auto_detect(path)
+        except ValueError:
+            if not path.exists():
+                raise FileNotFoundError(f"Trace file not found: {path}") from None
+            raise
 
         # Determine where records start
         # CRITICAL: Must skip header bytes when reading records
@@ -129,17 +166,21 @@ class TraceReader:
             yield from trace_file.adapter.decode_file(trace_file.path)
             return
 
-        # Binary files: skip header and read records
-        with open(trace_file.path, 'rb') as f:
-            # CRITICAL: Skip header if present
-            if trace_file.data_offset > 0:
-                f.seek(trace_file.data_offset)
+        # Binary files: decode records straight out of the buffer
+        buf = _load_file(trace_file.path)
+        if buf is None:
+            return
 
-            while True:
-                raw = f.read(record_size)
-                if len(raw) < record_size:
-                    break
-                yield trace_file.adapter.decode(raw)
+        decode = trace_file.adapter.decode
+        try:
+            with memoryview(buf) as view:
+                # CRITICAL: Skip header if present
+                end = len(view) - record_size
+                for offset in range(trace_file.data_offset, end + 1, record_size):
+                    yield decode(view[offset:offset + record_size])
+        finally:
+            if isinstance(buf, mmap.mmap):
+                buf.close()
 
     @classmethod
     def read_path(cls, path: Path) -> Iterator[StandardTrace]:
@@ -155,6 +196,113 @@ class TraceReader:
         trace_file = cls.open(path)
         yield from cls.read(trace_file)
 
+    @classmethod
+    def read_array(cls, path: Path) -> np.ndarray:
+        """
+        Map all records of a fixed-layout file as a numpy structured array.
+
+        The array is a read-only view over the file buffer, so no record
+        is copied or decoded in Python. Fields are named as in the
+        adapter's record dtype (e.g. 'seq_no', 't_ingress').
+
+        Args:
+            path: Path to trace file
+
+        Returns:
+            Structured array with one element per complete record
+
+        Raises:
+            ValueError: If the detected format has no fixed record dtype
+        """
+        trace_file = cls.open(path)
+        decode_many = getattr(trace_file.adapter, 'decode_many', None)
+
+        if decode_many is None:
+            raise ValueError(
+                f"{type(trace_file.adapter).__name__} does not support array reads"
+            )
+
+        return cls._read_array(trace_file, decode_many)
+
+    @staticmethod
+    def _read_array(trace_file: TraceFile, decode_many) -> np.ndarray:
+        """View the records of an opened file through decode_many."""
+        buf = _load_file(trace_file.path)
+        if buf is None:
+            return decode_many(b'')
+
+        # The returned array keeps the buffer alive
+        return decode_many(memoryview(buf)[trace_file.data_offset:])
+
+    @classmethod
+    def read_arrays(
+        cls,
+        paths: Iterable[Path],
+        max_workers: Optional[int] = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        Read several trace files as structured arrays, opening them in parallel.
+
+        Files are opened, detected and loaded on a thread pool, so the
+        blocking reads of different files overlap. Arrays are yielded in
+        the order of paths, one per file.
+
+        Args:
+            paths: Paths to fixed-layout trace files
+            max_workers: Thread count (ThreadPoolExecutor default if None)
+
+        Yields:
+            Structured array per file, as returned by read_array()
+
+        Raises:
+            ValueError: If a file has no fixed record dtype
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            yield from pool.map(cls.read_array, paths)
+
+    @classmethod
+    def iter_tx_events(cls, path: Path) -> Iterator[Tuple[int, int, int, int]]:
+        """
+        Yield (seq_no, t_ingress, t_egress, data) for each TX_EVENT record.
+
+        Formats with a record dtype are read column-wise in chunks, so no
+        StandardTrace is built per record. Other formats fall back to
+        decoding each record. Formats without sequence numbers yield 0.
+
+        Args:
+            path: Path to trace file
+
+        Yields:
+            Tuples of (seq_no, t_ingress, t_egress, data)
+        """
+        trace_file = cls.open(path)
+        decode_many = getattr(trace_file.adapter, 'decode_many', None)
+
+        if decode_many is None:
+            for trace in cls.read(trace_file):
+                if trace.record_type == RecordType.TX_EVENT:
+                    yield trace.seq_no, trace.t_ingress, trace.t_egress, trace.data
+            return
+
+        records = cls._read_array(trace_file, decode_many)
+        names = records.dtype.names
+        if 'record_type' in names:
+            records = records[records['record_type'] == RecordType.TX_EVENT]
+
+        for start in range(0, len(records), ITER_CHUNK_RECORDS):
+            chunk = records[start:start + ITER_CHUNK_RECORDS]
+            if 'seq_no' in names:
+                seq_nos = chunk['seq_no'].tolist()
+            else:
+                seq_nos = [0] * len(chunk)
+            yield from zip(
+                seq_nos,
+                chunk['t_ingress'].tolist(),
+                chunk['t_egress'].tolist(),
+                chunk['data'].tolist(),
+                strict=True,
+            )
+
     @classmethod
     def count(cls, path: Path) -> int:
         """
@@ -15,6 +15,8 @@ from typing import List, Optional, Iterator
 from pathlib import Path
 import math
 
+import numpy as np
+
 from .sequence import SequenceTracker
 from .quantiles import TDigestWrapper
 from .rolling_window import RollingWindowStats
@@ -23,6 +25,33 @@ from ..formats.reader import TraceReader
 from ..adapters.base import StandardTrace
 
 
+# Records handed to StreamingMetrics.add_batch at a time by analyze_file
+BATCH_RECORDS = 65536
+
+# Risk-control flag bits, in order: rate limit, position limit,
+# notional limit, kill switch (see _track_risk_flags)
+RISK_MASKS = np.array([0x0100, 0x0200, 0x0400, 0x0800], dtype=np.uint16)
+
+# Snapshot latency percentiles, looked up together in one digest query
+SNAPSHOT_PERCENTILES = (
+    ('p50_cycles', 0.50),
+    ('p75_cycles', 0.75),
+    ('p90_cycles', 0.90),
+    ('p95_cycles', 0.95),
+    ('p99_cycles', 0.99),
+    ('p999_cycles', 0.999),
+)
+_SNAPSHOT_KEYS = tuple(key for key, _ in SNAPSHOT_PERCENTILES)
+_SNAPSHOT_PS = tuple(p for _, p in SNAPSHOT_PERCENTILES)
+
+
+def _column(records: np.ndarray, name: str, default: int) -> np.ndarray:
+    """A record array column, or a constant column if the layout lacks it."""
+    if name in records.dtype.names:
+        return records[name]
+    return np.full(len(records), default, dtype=np.int64)
+
+
 @dataclass
 class StreamingConfig:
     """Configuration for streaming analysis."""
@@ -109,6 +138,135 @@ class StreamingMetrics:
         else:
             self.unknown_type_count += 1
 
+    def add_batch(self, records: np.ndarray) -> None:
+        """
+        Add a structured record array, e.g. from TraceReader.read_array().
+
+        Gives the same counters, sequence state and anomalies as calling
+        add() on each record in order (Welford state agrees to rounding),
+        but the per-record work runs in numpy. Columns missing from the
+        layout (v1.0 has no record_type, core_id or seq_no) take the
+        values the adapter's decode() would give them.
+        """
+        n = len(records)
+        if n == 0:
+            return
+
+        record_types = _column(records, 'record_type', RecordType.TX_EVENT)
+        is_tx = record_types == RecordType.TX_EVENT
+        is_overflow = record_types == RecordType.OVERFLOW
+        is_heartbeat = record_types == RecordType.HEARTBEAT
+        is_reset = record_types == RecordType.RESET
+
+        t_egress = records['t_egress']
+
+        self.overflow_count += int(np.count_nonzero(is_overflow))
+        self.overflow_traces_lost += sum(records['data'][is_overflow].tolist())
+        self.heartbeat_count += int(np.count_nonzero(is_heartbeat))
+        self.unknown_type_count += int(n - np.count_nonzero(
+            is_tx | is_overflow | is_heartbeat | is_reset
+        ))
+
+        # Timing: the latest TX egress or non-zero heartbeat egress wins
+        stamped = np.flatnonzero(is_tx | (is_heartbeat & (t_egress > 0)))
+        if len(stamped):
+            self.last_timestamp = int(t_egress[stamped[-1]])
+
+        self._check_sequences(records, is_tx, is_reset)
+
+        tx = records[is_tx]
+        if len(tx) == 0:
+            return
+
+        latencies = tx['t_egress'].astype(np.int64) - tx['t_ingress'].astype(np.int64)
+        timestamps = tx['t_egress']
+
+        self.tx_count += len(tx)
+        if self.first_timestamp is None:
+            self.first_timestamp = int(timestamps[0])
+
+        self._add_latencies(latencies, timestamps, tx['tx_id'])
+
+        self.global_min = min(self.global_min, int(latencies.min()))
+        self.global_max = max(self.global_max, int(latencies.max()))
+
+        self.global_digest.add_many(latencies)
+
+        for latency, timestamp in zip(latencies.tolist(), timestamps.tolist(), strict=True):
+            self.rolling_window.add(latency, timestamp)
+
+        # All risk bits counted in one (n, 4) mask reduction
+        rate, position, notional, kill = np.count_nonzero(
+            tx['flags'][:, None] & RISK_MASKS, axis=0
+        ).tolist()
+        self.rate_limit_rejects += rate
+        self.position_limit_rejects += position
+        self.notional_limit_rejects += notional
+        if kill:
+            self.kill_switch_triggered = True
+
+    def _check_sequences(
+        self, records: np.ndarray, is_tx: np.ndarray, is_reset: np.ndarray
+    ) -> None:
+        """Run drop detection over a batch, applying RESETs in order."""
+        core_ids = _column(records, 'core_id', 0)
+        seq_nos = _column(records, 'seq_no', 0)
+        t_egress = records['t_egress']
+
+        start = 0
+        for reset in np.flatnonzero(is_reset).tolist() + [len(records)]:
+            tx = np.flatnonzero(is_tx[start:reset]) + start
+            if len(tx):
+                self.sequence_tracker.check_batch(core_ids[tx], seq_nos[tx], t_egress[tx])
+            if reset < len(records):
+                self.reset_count += 1
+                self.sequence_tracker.handle_reset(
+                    int(core_ids[reset]), int(seq_nos[reset]), int(t_egress[reset])
+                )
+            start = reset + 1
+
+    def _add_latencies(
+        self, latencies: np.ndarray, timestamps: np.ndarray, tx_ids: np.ndarray
+    ) -> None:
+        """
+        Fold a run of latencies into the Welford state and flag anomalies.
+
+        The running mean and M2 after each value are computed from prefix
+        sums of deviations from a shift point (the current mean), which
+        keeps them stable without a per-value loop.
+        """
+        x = latencies.astype(np.float64)
+        n0, mean0, m2_0 = self.global_count, self.global_mean, self.global_m2
+
+        shift = mean0 if n0 else x[0]
+        y = x - shift
+        counts = np.arange(n0 + 1, n0 + len(x) + 1, dtype=np.float64)
+        sum_y = n0 * (mean0 - shift) + np.cumsum(y)
+        sum_yy = m2_0 + n0 * (mean0 - shift) ** 2 + np.cumsum(y * y)
+
+        means = shift + sum_y / counts
+        m2s = np.maximum(sum_yy - sum_y * sum_y / counts, 0.0)
+
+        self.global_count = n0 + len(x)
+        self.global_mean = float(means[-1])
+        self.global_m2 = float(m2s[-1])
+
+        # === Anomaly detection (against the stats including each value) ===
+        with np.errstate(divide='ignore', invalid='ignore'):
+            stddevs = np.sqrt(m2s / (counts - 1))
+            zscores = (x - means) / stddevs
+        flagged = np.flatnonzero(
+            (counts > 30) & (stddevs > 0) & (zscores > self.config.anomaly_zscore)
+        )
+        if len(flagged):
+            self.anomalies.extend(zip(
+                timestamps[flagged].tolist(),
+                tx_ids[flagged].tolist(),
+                latencies[flagged].tolist(),
+                zscores[flagged].tolist(),
+                strict=True,
+            ))
+
     def _add_transaction(self, trace: StandardTrace) -> None:
         """
         Process TX_EVENT - the ONLY type affecting latency stats.
@@ -206,20 +364,19 @@ class StreamingMetrics:
 
         seq = self.sequence_tracker
 
+        latency = {
+            'count': self.global_count,
+            'min_cycles': int(self.global_min) if self.global_count > 0 else 0,
+            'max_cycles': int(self.global_max) if self.global_count > 0 else 0,
+            'mean_cycles': round(self.global_mean, 2),
+            'stddev_cycles': round(self.global_stddev(), 2),
+        }
+        percentiles = self.global_digest.percentiles(_SNAPSHOT_PS)
+        for key, value in zip(_SNAPSHOT_KEYS, percentiles, strict=True):
+            latency[key] = int(value)
+
         return {
-            'latency': {
-                'count': self.global_count,
-                'min_cycles': int(self.global_min) if self.global_count > 0 else 0,
-                'max_cycles': int(self.global_max) if self.global_count > 0 else 0,
-                'mean_cycles': round(self.global_mean, 2),
-                'stddev_cycles': round(self.global_stddev(), 2),
-                'p50_cycles': int(self.global_percentile(0.50)),
-                'p75_cycles': int(self.global_percentile(0.75)),
-                'p90_cycles': int(self.global_percentile(0.90)),
-                'p95_cycles': int(self.global_percentile(0.95)),
-                'p99_cycles': int(self.global_percentile(0.99)),
-                'p999_cycles': int(self.global_percentile(0.999)),
-            },
+            'latency': latency,
             'throughput': {
                 'tx_per_second': round(self.global_count / duration, 2) if duration > 0 else 0,
                 'duration_seconds': round(duration, 4),
@@ -263,8 +420,15 @@ class StreamingAnalyzer:
 
     def analyze_file(self, path: Path) -> dict:
         """Analyze a trace file and return metrics."""
-        for trace in TraceReader.read_path(path):
-            self.metrics.add(trace)
+        try:
+            records = TraceReader.read_array(path)
+        except ValueError:
+            # No fixed record dtype (e.g. CSV): decode trace by trace
+            for trace in TraceReader.read_path(path):
+                self.metrics.add(trace)
+        else:
+            for start in range(0, len(records), BATCH_RECORDS):
+                self.metrics.add_batch(records[start:start + BATCH_RECORDS])
         return self.metrics.snapshot()
 
     def reset(self) -> None:
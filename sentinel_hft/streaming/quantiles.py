@@ -9,7 +9,9 @@ DDSketch reference: https://arxiv.org/abs/1908.10693
 """
 
 import math
-from typing import Dict
+from typing import Dict, List
+
+import numpy as np
 
 
 class DDSketch:
@@ -56,6 +58,9 @@ class DDSketch:
         self._min: float = float('inf')
         self._max: float = float('-inf')
 
+        # (bucket values, cumulative counts), rebuilt lazily after updates
+        self._cdf = None
+
     def _bucket_index(self, value: float) -> int:
         """Map a positive value to its bucket index."""
         if value <= 0:
@@ -76,6 +81,7 @@ class DDSketch:
 
     def add(self, value: float) -> None:
         """Add a value to the sketch."""
+        self._cdf = None
         self._count += 1
         self._min = min(self._min, value)
         self._max = max(self._max, value)
@@ -89,6 +95,39 @@ class DDSketch:
         else:
             self.zero_count += 1
 
+    def add_many(self, values) -> None:
+        """
+        Add an array of values in one pass.
+
+        Same buckets as calling add() per value, but the logs and bucket
+        counts are computed in numpy and merged once per distinct bucket.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return
+
+        self._cdf = None
+        self._count += int(values.size)
+        self._min = min(self._min, float(values.min()))
+        self._max = max(self._max, float(values.max()))
+
+        self._add_to_buckets(self.positive_buckets, values[values > 0])
+        self._add_to_buckets(self.negative_buckets, -values[values < 0])
+        self.zero_count += int(np.count_nonzero(values == 0))
+
+    def _add_to_buckets(self, buckets: Dict[int, int], magnitudes: np.ndarray) -> None:
+        """Bucket positive magnitudes and fold the counts into buckets."""
+        if magnitudes.size == 0:
+            return
+        indices = np.ceil(np.log(magnitudes) / self.log_gamma).astype(np.int64)
+        # Bucket indices span a narrow range (log scale), so a bincount over
+        # the offset indices counts them in one linear pass without sorting
+        lowest = int(indices.min())
+        counts = np.bincount(indices - lowest)
+        for offset in np.flatnonzero(counts).tolist():
+            idx = lowest + offset
+            buckets[idx] = buckets.get(idx, 0) + int(counts[offset])
+
     def percentile(self, p: float) -> float:
         """
         Get value at percentile p.
@@ -109,27 +148,60 @@ class DDSketch:
         if p == 1:
             return self._max
 
-        target_rank = p * self._count
-        cumulative = 0
+        values, cumulative = self._cumulative()
+
+        # First bucket whose cumulative count reaches the target rank
+        i = int(np.searchsorted(cumulative, p * self._count))
+        if i == len(values):
+            return self._max
+        return float(values[i])
 
-        # Walk through negative buckets (descending)
-        for idx in sorted(self.negative_buckets.keys(), reverse=True):
-            cumulative += self.negative_buckets[idx]
-            if cumulative >= target_rank:
-                return -self._bucket_value(idx)
+    def percentiles(self, ps) -> List[float]:
+        """
+        Get values at several percentiles with one vectorized lookup.
 
-        # Zero bucket
-        cumulative += self.zero_count
-        if cumulative >= target_rank:
-            return 0.0
+        Equivalent to [self.percentile(p) for p in ps].
+        """
+        if self._count == 0:
+            return [0.0] * len(ps)
+
+        values, cumulative = self._cumulative()
+        ranks = np.array(ps, dtype=np.float64) * self._count
+        indices = cumulative.searchsorted(ranks).tolist()
+
+        n = len(values)
+        out = []
+        for p, i in zip(ps, indices, strict=True):
+            if p <= 0:
+                out.append(self._min)
+            elif p >= 1 or i == n:
+                out.append(self._max)
+            else:
+                out.append(float(values[i]))
+        return out
+
+    def _cumulative(self):
+        """
+        Bucket values in ascending order with their cumulative counts.
 
-        # Walk through positive buckets (ascending)
-        for idx in sorted(self.positive_buckets.keys()):
-            cumulative += self.positive_buckets[idx]
-            if cumulative >= target_rank:
-                return self._bucket_value(idx)
+        Negative buckets (descending index), then zero, then positive
+        buckets (ascending index). Cached until the next add or merge, so
+        a snapshot asking for several percentiles sorts the buckets once.
+        """
+        if self._cdf is None:
+            neg = sorted(self.negative_buckets, reverse=True)
+            pos = sorted(self.positive_buckets)
 
-        return self._max
+            values = [-self._bucket_value(idx) for idx in neg]
+            values.append(0.0)
+            values.extend(self._bucket_value(idx) for idx in pos)
+
+            counts = [self.negative_buckets[idx] for idx in neg]
+            counts.append(self.zero_count)
+            counts.extend(self.positive_buckets[idx] for idx in pos)
+
+            self._cdf = (np.array(values), np.cumsum(counts))
+        return self._cdf
 
     def merge(self, other: 'DDSketch') -> None:
         """Merge another DDSketch into this one."""
@@ -139,6 +211,8 @@ class DDSketch:
                 f"{self.alpha} vs {other.alpha}"
             )
 
+        self._cdf = None
+
         for idx, count in other.positive_buckets.items():
             self.positive_buckets[idx] = self.positive_buckets.get(idx, 0) + count
 
@@ -201,6 +275,21 @@ class TDigestWrapper:
         else:
             self._impl.add(value)
 
+    def add_many(self, values) -> None:
+        """Add an array of values (vectorized on the DDSketch fallback)."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return
+
+        self._count += int(values.size)
+        self._min = min(self._min, float(values.min()))
+        self._max = max(self._max, float(values.max()))
+
+        if self._is_tdigest:
+            self._impl.batch_update(values)
+        else:
+            self._impl.add_many(values)
+
     def percentile(self, p: float) -> float:
         """Get percentile (p in 0.0-1.0)."""
         if self._count == 0:
@@ -214,6 +303,17 @@ class TDigestWrapper:
         else:
             return self._impl.percentile(p)
 
+    def percentiles(self, ps) -> List[float]:
+        """Get several percentiles (p in 0.0-1.0) in one call."""
+        if self._count == 0:
+            return [0.0] * len(ps)
+
+        ps = [max(0.001, min(0.999, p)) for p in ps]
+
+        if self._is_tdigest:
+            return [self._impl.percentile(p * 100) for p in ps]
+        return self._impl.percentiles(ps)
+
     def merge(self, other: 'TDigestWrapper') -> None:
         """Merge another estimator into this one."""
         if self._is_tdigest and other._is_tdigest:
@@ -4,6 +4,7 @@ Rolling window statistics using time-bucketed quantile sketches.
 This provides "P99 over the last 60 seconds" without storing all values.
 """
 
+import math
 from collections import deque
 from dataclasses import dataclass
 from typing import Optional
@@ -53,6 +54,12 @@ class RollingWindowStats:
         self.buckets: deque = deque()
         self.current_bucket: Optional[WindowBucket] = None
         self._sample_count: int = 0
+        # Merged digest of the closed buckets; rebuilt lazily after a
+        # rotation or expiry so percentile() only merges the open bucket
+        self._closed_digest: Optional[TDigestWrapper] = None
+        # Start time of the oldest closed bucket (inf when none), so add()
+        # only calls into expiry when something can actually expire
+        self._oldest_start: float = math.inf
 
     def _timestamp_to_seconds(self, timestamp: int) -> float:
         """Convert cycles to seconds."""
@@ -73,7 +80,10 @@ class RollingWindowStats:
         # Check if we need to rotate to new bucket
         bucket_end = self.current_bucket.start_time + self.bucket_seconds
         if ts_sec >= bucket_end:
+            if not self.buckets:
+                self._oldest_start = self.current_bucket.start_time
             self.buckets.append(self.current_bucket)
+            self._closed_digest = None
             self.current_bucket = WindowBucket(
                 start_time=ts_sec,
                 digest=TDigestWrapper(),
@@ -86,7 +96,8 @@ class RollingWindowStats:
         self._sample_count += 1
 
         # Expire old buckets
-        self._expire_buckets(ts_sec)
+        if self._oldest_start < ts_sec - self.window_seconds:
+            self._expire_buckets(ts_sec)
 
     def _expire_buckets(self, current_time: float) -> None:
         """Remove buckets older than window."""
@@ -95,6 +106,9 @@ class RollingWindowStats:
         while self.buckets and self.buckets[0].start_time < cutoff:
             expired = self.buckets.popleft()
             self._sample_count -= expired.sample_count
+            self._closed_digest = None
+
+        self._oldest_start = self.buckets[0].start_time if self.buckets else math.inf
 
     @property
     def sample_count(self) -> int:
@@ -106,11 +120,13 @@ class RollingWindowStats:
         if self._sample_count == 0:
             return 0.0
 
-        # Merge all bucket digests
-        merged = TDigestWrapper()
+        if self._closed_digest is None:
+            self._closed_digest = TDigestWrapper()
+            for bucket in self.buckets:
+                self._closed_digest.merge(bucket.digest)
 
-        for bucket in self.buckets:
-            merged.merge(bucket.digest)
+        merged = TDigestWrapper()
+        merged.merge(self._closed_digest)
 
         if self.current_bucket and self.current_bucket.sample_count > 0:
             merged.merge(self.current_bucket.digest)
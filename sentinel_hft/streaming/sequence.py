@@ -6,7 +6,7 @@ CRITICAL: Python integers don't wrap! We must explicitly mask to u32.
 This module provides:
 - u32(): Constrain value to u32 range
 - u32_distance(): Signed distance in u32 space (handles wrap)
-- SequenceTracker: Detect drops vs reorders per core
+- SequenceTracker: Detect drops vs reorders per core (per trace or in batches)
 
 Example of the bug we're fixing:
     # Python doesn't wrap
@@ -21,6 +21,8 @@ Example of the bug we're fixing:
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
+import numpy as np
+
 
 # u32 constants
 U32_MAX = 0xFFFFFFFF           # 4,294,967,295
@@ -64,24 +66,14 @@ def u32_distance(from_seq: int, to_seq: int) -> int:
         u32_distance(1, 0xFFFFFFFE) = -3 # Wrap backward
 
     Algorithm:
-        1. Compute unsigned difference: (to - from) mod 2^32
-        2. If diff < 2^31: positive (forward)
-        3. If diff >= 2^31: negative (backward), subtract 2^32
+        Reinterpret the unsigned difference (to - from) mod 2^32 as a
+        two's-complement i32: bias by 2^31, wrap, then remove the bias.
+        Diffs >= 2^31 come out negative with no comparison or branch.
     """
-    from_seq = u32(from_seq)
-    to_seq = u32(to_seq)
-
-    # Unsigned difference with wrap
-    diff = u32(to_seq - from_seq)
+    return ((to_seq - from_seq + U32_HALF) & U32_MAX) - U32_HALF
 
-    # Interpret as signed using two's complement logic:
-    # If the unsigned diff is >= half the range, it's actually negative
-    if diff >= U32_HALF:
-        return diff - U32_MODULUS
-    return diff
 
-
-@dataclass
+@dataclass(slots=True)
 class DropEvent:
     """
     Record of detected trace drops.
@@ -202,6 +194,118 @@ class SequenceTracker:
             # Don't update expected - we're seeing an old packet
             return None
 
+    def check_batch(self, core_ids, seq_nos, timestamps) -> List[DropEvent]:
+        """
+        Check many traces at once, in arrival order.
+
+        Equivalent to calling check() for each (core_id, seq_no, timestamp)
+        triple in turn (same counters, events and per-core state), but
+        the per-trace work is done in numpy. Returns the DropEvents found
+        in this batch.
+
+        Each core's sequence numbers are unwrapped to a monotonic int64
+        axis by accumulating signed u32 steps, so this assumes consecutive
+        traces from a core are less than 2^31 apart -- the same horizon
+        u32_distance() already relies on.
+        """
+        core_ids = np.asarray(core_ids, dtype=np.int64)
+        seqs = np.asarray(seq_nos, dtype=np.int64) & U32_MAX
+        timestamps = np.asarray(timestamps)
+
+        if len(core_ids) == 0:
+            return []
+
+        drop_idx, drop_expected, drop_count = [], [], []
+        reorder_idx, reorder_expected = [], []
+
+        order = np.argsort(core_ids, kind='stable')
+        cores, starts = np.unique(core_ids[order], return_index=True)
+
+        for core_id, idx in zip(cores.tolist(), np.split(order, starts[1:]), strict=True):
+            core_seqs = seqs[idx]
+
+            if core_id in self.expected_seq:
+                # Seed the walk with the last in-order sequence seen
+                base = u32(self.expected_seq[core_id] - 1)
+            else:
+                # First trace from this core only initializes tracking
+                base = int(core_seqs[0])
+                idx, core_seqs = idx[1:], core_seqs[1:]
+
+            # Signed u32 steps (as in u32_distance) -> positions relative to base
+            steps = ((np.diff(core_seqs, prepend=base) + U32_HALF) & U32_MAX) - U32_HALF
+            pos = np.cumsum(steps)
+
+            # Highest position seen before each trace; expected is one past it
+            prior_max = np.maximum.accumulate(np.concatenate(([0], pos)))
+            distance = pos - prior_max[:-1] - 1
+            expected = (base + prior_max[:-1] + 1) & U32_MAX
+
+            gaps = distance > 0
+            drop_idx.append(idx[gaps])
+            drop_expected.append(expected[gaps])
+            drop_count.append(distance[gaps])
+
+            late = distance < 0
+            reorder_idx.append(idx[late])
+            reorder_expected.append(expected[late])
+
+            last = u32(base + int(prior_max[-1]))
+            self.expected_seq[core_id] = u32_add(last, 1)
+            self.max_seen_seq[core_id] = last
+
+        events = []
+        drop_idx = np.concatenate(drop_idx)
+        if len(drop_idx):
+            by_arrival = np.argsort(drop_idx, kind='stable')
+            drop_idx = drop_idx[by_arrival]
+            rows = zip(
+                core_ids[drop_idx].tolist(),
+                np.concatenate(drop_expected)[by_arrival].tolist(),
+                seqs[drop_idx].tolist(),
+                np.concatenate(drop_count)[by_arrival].tolist(),
+                timestamps[drop_idx].tolist(),
+                strict=True,
+            )
+            for core_id, expected, seq, dropped, timestamp in rows:
+                # Detect wrap (expected near max, actual near zero)
+                is_wrap = expected > 0xFFFF0000 and seq < 0x10000
+                events.append(DropEvent(
+                    core_id=core_id,
+                    expected_seq=expected,
+                    actual_seq=seq,
+                    dropped_count=dropped,
+                    timestamp=timestamp,
+                    event_type='wrap' if is_wrap else 'gap',
+                ))
+                self.total_dropped += dropped
+            self.drop_events.extend(events)
+
+        reorder_idx = np.concatenate(reorder_idx)
+        if len(reorder_idx):
+            by_arrival = np.argsort(reorder_idx, kind='stable')
+            reorder_idx = reorder_idx[by_arrival]
+            self.total_reorders += len(reorder_idx)
+            self.reorder_events.extend(zip(
+                core_ids[reorder_idx].tolist(),
+                np.concatenate(reorder_expected)[by_arrival].tolist(),
+                seqs[reorder_idx].tolist(),
+                timestamps[reorder_idx].tolist(),
+                strict=True,
+            ))
+
+        return events
+
+    def check_array(self, records: np.ndarray) -> List[DropEvent]:
+        """
+        Check a structured record array, e.g. from TraceReader.read_array().
+
+        Uses the 'core_id', 'seq_no' and 't_egress' columns (the v1.1
+        record layout). Every record is checked; select the TX_EVENT rows
+        first if other record types should not count.
+        """
+        return self.check_batch(records['core_id'], records['seq_no'], records['t_egress'])
+
     def _update_max_seen(self, core_id: int, seq: int):
         """Update max seen sequence, handling wrap."""
         current_max = self.max_seen_seq.get(core_id, 0)
@@ -9,11 +9,12 @@ Requirements:
 - Counter values should match expected backpressure duration
 """
 
-import re
 import pytest
 from pathlib import Path
 
-from conftest import SimulationRunner, build_for_latency
+from conftest import (
+    SimulationRunner, build_for_latency, decode_output, latency_params, require_counters,
+)
 
 
 class TestBackpressure:
@@ -23,14 +24,6 @@ class TestBackpressure:
     def setup(self, sim_dir: Path):
         self.sim_dir = sim_dir
 
-    def _extract_counter(self, output: str, counter_name: str) -> int:
-        """Extract counter value from simulation output."""
-        pattern = rf"{counter_name}:\s*(\d+)"
-        match = re.search(pattern, output)
-        if match:
-            return int(match.group(1))
-        raise ValueError(f"Could not find {counter_name} in output")
-
     def test_backpressure_basic(self):
         """Verify backpressure counter increments under backpressure."""
         runner = build_for_latency(self.sim_dir, 2)
@@ -44,10 +37,11 @@ class TestBackpressure:
             bp_cycles=bp_cycles
         )
 
-        assert result.returncode == 0, f"Test failed: {result.stdout}"
+        assert result.returncode == 0, f"Test failed: {decode_output(result.stdout)}"
 
         # Extract counter value
-        in_bp = self._extract_counter(result.stdout, "In backpressure cycles")
+        counters = require_counters(result)
+        in_bp = counters['in_bp']
 
         # Counter should be at least bp_cycles (might be more due to pipeline)
         assert in_bp >= bp_cycles - 5, (
@@ -68,7 +62,8 @@ class TestBackpressure:
 
         assert result.returncode == 0
 
-        in_bp = self._extract_counter(result.stdout, "In backpressure cycles")
+        counters = require_counters(result)
+        in_bp = counters['in_bp']
 
         # Allow some tolerance for pipeline timing
         assert bp_cycles - 5 <= in_bp <= bp_cycles + 10, (
@@ -88,8 +83,9 @@ class TestBackpressure:
 
         assert result.returncode == 0
 
-        in_bp = self._extract_counter(result.stdout, "In backpressure cycles")
-        out_bp = self._extract_counter(result.stdout, "Out backpressure cycles")
+        counters = require_counters(result)
+        in_bp = counters['in_bp']
+        out_bp = counters['out_bp']
 
         # With no intentional backpressure, counters should be low
         # (might have some due to pipeline effects)
@@ -112,7 +108,8 @@ class TestBackpressure:
 
             assert result.returncode == 0
 
-            in_bp = self._extract_counter(result.stdout, "In backpressure cycles")
+            counters = require_counters(result)
+            in_bp = counters['in_bp']
             results.append((bp_cycles, in_bp))
 
         # Verify that higher requested BP leads to higher measured BP
@@ -140,17 +137,16 @@ class TestBackpressure:
         assert result.returncode == 0
 
         # Extract counters
-        out_bp = self._extract_counter(result.stdout, "Out backpressure cycles")
+        counters = require_counters(result)
+        out_bp = counters['out_bp']
 
         # Should have some output backpressure due to test design
         # (test forces out_ready=0 which causes output backpressure)
         assert out_bp > 0, f"Expected output backpressure, got {out_bp}"
 
-    @pytest.mark.parametrize("latency", [1, 5, 10])
-    def test_backpressure_across_latencies(self, latency: int):
+    @pytest.mark.parametrize("latency", latency_params(1, 5, 10), indirect=True)
+    def test_backpressure_across_latencies(self, latency: int, runner: SimulationRunner):
         """Verify backpressure tracking works for different core latencies."""
-        runner = build_for_latency(self.sim_dir, latency)
-
         bp_cycles = 15
 
         result = runner.run(
@@ -162,7 +158,8 @@ class TestBackpressure:
 
         assert result.returncode == 0
 
-        in_bp = self._extract_counter(result.stdout, "In backpressure cycles")
+        counters = require_counters(result)
+        in_bp = counters['in_bp']
 
         # Backpressure should be tracked regardless of latency
         assert in_bp >= bp_cycles - 5, (
@@ -4,22 +4,26 @@ Verifies that running the same input sequence twice produces
 bit-identical trace output.
 
 Requirement:
-- Same input + same RNG seed = identical trace byte streams (SHA256 hash match)
+- Same input + same RNG seed = identical trace byte streams
 """
 
+import filecmp
 import hashlib
 import pytest
 from pathlib import Path
 
-from conftest import SimulationRunner, build_for_latency
+from conftest import (
+    SimulationRunner, build_for_latency, decode_output, latency_params,
+)
 
 
 class TestDeterminism:
     """Test deterministic behavior of the sentinel shell."""
 
     @pytest.fixture(autouse=True)
-    def setup(self, sim_dir: Path, deterministic_seed: int):
+    def setup(self, sim_dir: Path, trace_dir: Path, deterministic_seed: int):
         self.sim_dir = sim_dir
+        self.trace_dir = trace_dir
         self.seed = deterministic_seed
 
     def _hash_trace_file(self, filepath: Path) -> str:
@@ -27,6 +31,12 @@ class TestDeterminism:
         with open(filepath, 'rb') as f:
             return hashlib.sha256(f.read()).hexdigest()
 
+    def _traces_equal(self, trace_file1: str, trace_file2: str) -> bool:
+        """Byte-compare two trace files (stops at the first difference)."""
+        return filecmp.cmp(
+            self.trace_dir / trace_file1, self.trace_dir / trace_file2, shallow=False
+        )
+
     def test_determinism_basic(self):
         """Verify two runs with same seed produce identical traces."""
         runner = build_for_latency(self.sim_dir, 3)
@@ -41,8 +51,7 @@ class TestDeterminism:
             output_file=trace_file1,
             seed=self.seed
         )
-        assert result1.returncode == 0, f"Run 1 failed: {result1.stdout}"
-        hash1 = self._hash_trace_file(self.sim_dir / trace_file1)
+        assert result1.returncode == 0, f"Run 1 failed: {decode_output(result1.stdout)}"
 
         # Run 2 (same seed)
         result2 = runner.run(
@@ -51,12 +60,12 @@ class TestDeterminism:
             output_file=trace_file2,
             seed=self.seed
         )
-        assert result2.returncode == 0, f"Run 2 failed: {result2.stdout}"
-        hash2 = self._hash_trace_file(self.sim_dir / trace_file2)
+        assert result2.returncode == 0, f"Run 2 failed: {decode_output(result2.stdout)}"
 
-        # Verify hashes match
-        assert hash1 == hash2, (
-            f"Trace hashes differ: {hash1} vs {hash2}"
+        # Verify traces match (hashes are only computed for the failure message)
+        assert self._traces_equal(trace_file1, trace_file2), (
+            f"Trace hashes differ: {self._hash_trace_file(self.trace_dir / trace_file1)} "
+            f"vs {self._hash_trace_file(self.trace_dir / trace_file2)}"
         )
 
     def test_determinism_different_seeds(self):
@@ -74,7 +83,6 @@ class TestDeterminism:
             seed=0x12345678
         )
         assert result1.returncode == 0
-        hash1 = self._hash_trace_file(self.sim_dir / trace_file1)
 
         # Run with different seed
         result2 = runner.run(
@@ -84,18 +92,15 @@ class TestDeterminism:
             seed=0xABCDEF00
         )
         assert result2.returncode == 0
-        hash2 = self._hash_trace_file(self.sim_dir / trace_file2)
 
-        # Hashes should differ (different input data)
-        assert hash1 != hash2, (
+        # Traces should differ (different input data)
+        assert not self._traces_equal(trace_file1, trace_file2), (
             f"Different seeds should produce different traces"
         )
 
-    @pytest.mark.parametrize("latency", [1, 5, 10])
-    def test_determinism_across_latencies(self, latency: int):
+    @pytest.mark.parametrize("latency", latency_params(1, 5, 10), indirect=True)
+    def test_determinism_across_latencies(self, latency: int, runner: SimulationRunner):
         """Verify determinism holds for different core latencies."""
-        runner = build_for_latency(self.sim_dir, latency)
-
         trace_file1 = f'trace_det_lat{latency}_1.bin'
         trace_file2 = f'trace_det_lat{latency}_2.bin'
 
@@ -115,10 +120,7 @@ class TestDeterminism:
         )
         assert result2.returncode == 0
 
-        hash1 = self._hash_trace_file(self.sim_dir / trace_file1)
-        hash2 = self._hash_trace_file(self.sim_dir / trace_file2)
-
-        assert hash1 == hash2, (
+        assert self._traces_equal(trace_file1, trace_file2), (
             f"Non-deterministic behavior at LATENCY={latency}"
         )
 
@@ -145,10 +147,7 @@ class TestDeterminism:
         )
         assert result2.returncode == 0
 
-        hash1 = self._hash_trace_file(self.sim_dir / trace_file1)
-        hash2 = self._hash_trace_file(self.sim_dir / trace_file2)
-
-        assert hash1 == hash2
+        assert self._traces_equal(trace_file1, trace_file2)
 
     def test_trace_record_consistency(self):
         """Verify trace records are byte-for-byte identical across runs."""
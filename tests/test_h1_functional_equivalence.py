@@ -10,136 +10,123 @@ Requirements:
 - Shell is transparent to the data path
 """
 
+import numpy as np
 import pytest
 from pathlib import Path
 
-from conftest import SimulationRunner, build_for_latency
+from conftest import (
+    DETERMINISTIC_SEED, SimulationRunner, build_for_latency, decode_output, latency_params,
+)
 
 
 class TestFunctionalEquivalence:
     """Test functional equivalence of wrapped vs unwrapped core."""
 
+    # Shared by the transaction-count invariants below
+    EQUIV_NUM_TX = 200
+
     @pytest.fixture(autouse=True)
     def setup(self, sim_dir: Path, deterministic_seed: int):
         self.sim_dir = sim_dir
         self.seed = deterministic_seed
 
-    def test_equivalence_basic(self):
-        """Verify basic functional equivalence."""
-        runner = build_for_latency(self.sim_dir, 3)
+    @pytest.fixture(scope="class")
+    def equiv_traces(self, sim_dir: Path):
+        """Run one equivalence sim and parse its traces for the whole class."""
+        runner = build_for_latency(sim_dir, 2)
 
         result = runner.run(
             test_name='equivalence',
-            num_tx=100,
-            output_file='trace_equiv.bin',
-            seed=self.seed
+            num_tx=self.EQUIV_NUM_TX,
+            output_file='trace_equiv_shared.bin',
+            seed=DETERMINISTIC_SEED
         )
 
-        assert result.returncode == 0, f"Test failed: {result.stdout}"
-        assert "PASS" in result.stdout, f"Equivalence test did not pass: {result.stdout}"
+        assert result.returncode == 0, f"Test failed: {decode_output(result.stdout)}"
 
-    def test_equivalence_transaction_count(self):
-        """Verify all transactions pass through."""
-        runner = build_for_latency(self.sim_dir, 2)
+        return runner.load_trace_array('trace_equiv_shared.bin')
 
-        num_tx = 150
+    @pytest.mark.parametrize("num_tx,check_flags", [
+        pytest.param(100, True, id="basic"),
+        pytest.param(1000, False, id="stress"),
+    ])
+    def test_equivalence_matrix(self, num_tx: int, check_flags: bool):
+        """Verify all transactions pass through, uncorrupted, under load."""
+        runner = build_for_latency(self.sim_dir, 3)
 
         result = runner.run(
             test_name='equivalence',
             num_tx=num_tx,
-            output_file='trace_count.bin'
-        )
-
-        assert result.returncode == 0
-
-        traces = runner.load_traces('trace_count.bin')
-        assert len(traces) == num_tx, (
-            f"Expected {num_tx} traces, got {len(traces)}"
-        )
-
-    @pytest.mark.parametrize("latency", [1, 2, 5, 10, 15])
-    def test_equivalence_across_latencies(self, latency: int):
-        """Verify equivalence holds for various core latencies."""
-        runner = build_for_latency(self.sim_dir, latency)
-
-        result = runner.run(
-            test_name='equivalence',
-            num_tx=50,
-            output_file=f'trace_equiv_lat{latency}.bin',
+            output_file=f'trace_equiv_{num_tx}.bin',
             seed=self.seed
         )
 
-        assert result.returncode == 0, (
-            f"LATENCY={latency} failed: {result.stdout}"
-        )
-        assert "PASS" in result.stdout
-
-    def test_equivalence_stress(self):
-        """Stress test with many transactions."""
-        runner = build_for_latency(self.sim_dir, 4)
-
-        num_tx = 1000
-
-        result = runner.run(
-            test_name='equivalence',
-            num_tx=num_tx,
-            output_file='trace_stress.bin'
-        )
-
-        assert result.returncode == 0, f"Stress test failed: {result.stdout}"
+        assert result.returncode == 0, f"Test failed: {decode_output(result.stdout)}"
+        assert b"PASS" in result.stdout, f"Equivalence test did not pass: {decode_output(result.stdout)}"
 
-        traces = runner.load_traces('trace_stress.bin')
+        traces = runner.load_trace_array(f'trace_equiv_{num_tx}.bin')
         assert len(traces) == num_tx
 
-    def test_no_extra_transactions(self):
-        """Verify no spurious transactions are generated."""
-        runner = build_for_latency(self.sim_dir, 3)
-
-        num_tx = 75
+        if check_flags:
+            # Verify no error flags set (would indicate corruption)
+            bad = np.flatnonzero(traces['flags'])
+            assert bad.size == 0, (
+                f"Trace {bad[0]} has unexpected flags: {traces['flags'][bad[0]]:04x}"
+            )
 
-        result = runner.run(
-            test_name='equivalence',
-            num_tx=num_tx,
-            output_file='trace_extra.bin'
+    def test_equivalence_transaction_count(self, equiv_traces):
+        """Verify one trace comes out per transaction sent."""
+        num_tx = self.EQUIV_NUM_TX
+        assert len(equiv_traces) == num_tx, (
+            f"Expected {num_tx} traces, got {len(equiv_traces)}"
         )
 
-        assert result.returncode == 0
-
-        traces = runner.load_traces('trace_extra.bin')
+    def test_no_extra_transactions(self, equiv_traces):
+        """Verify no spurious or duplicated transactions are generated."""
+        tx_ids = equiv_traces['tx_id']
 
-        # Should have exactly num_tx traces
-        assert len(traces) == num_tx, (
-            f"Expected {num_tx} traces, got {len(traces)} (extra transactions?)"
+        spurious = tx_ids[tx_ids >= self.EQUIV_NUM_TX]
+        assert spurious.size == 0, (
+            f"Spurious tx_ids never sent: {spurious[:10].tolist()}"
         )
 
-        # Verify tx_ids are sequential without gaps or duplicates
-        tx_ids = [t.tx_id for t in traces]
-        expected = list(range(num_tx))
-        assert tx_ids == expected, (
-            f"Transaction sequence mismatch: got {tx_ids[:10]}... expected {expected[:10]}..."
-        )
+        unique, counts = np.unique(tx_ids, return_counts=True)
+        dups = unique[counts > 1]
+        assert dups.size == 0, f"Duplicated tx_ids: {dups[:10].tolist()}"
 
-    def test_no_missing_transactions(self):
+    def test_no_missing_transactions(self, equiv_traces):
         """Verify no transactions are lost through the shell."""
-        runner = build_for_latency(self.sim_dir, 5)
+        expected = np.arange(self.EQUIV_NUM_TX, dtype=np.uint64)
+        tx_ids = equiv_traces['tx_id']
+        missing = np.setdiff1d(expected, tx_ids)
+        assert missing.size == 0, (
+            f"Missing tx_ids: {missing[:10].tolist()}"
+        )
 
-        num_tx = 200
+        # Each record carries its own tx_id, in issue order
+        n = min(len(tx_ids), len(expected))
+        bad = np.flatnonzero(tx_ids[:n] != expected[:n])
+        first = bad[0] if bad.size else n
+        assert np.array_equal(tx_ids, expected), (
+            f"tx_id sequence diverges at index {first}: "
+            f"got {tx_ids[first:first + 5].tolist()}, "
+            f"expected {expected[first:first + 5].tolist()}"
+        )
 
+    @pytest.mark.parametrize("latency", latency_params(1, 2, 5, 10, 15), indirect=True)
+    def test_equivalence_across_latencies(self, latency: int, runner: SimulationRunner):
+        """Verify equivalence holds for various core latencies."""
         result = runner.run(
             test_name='equivalence',
-            num_tx=num_tx,
-            output_file='trace_missing.bin'
+            num_tx=50,
+            output_file=f'trace_equiv_lat{latency}.bin',
+            seed=self.seed
         )
 
-        assert result.returncode == 0
-
-        traces = runner.load_traces('trace_missing.bin')
-
-        # Check no gaps in tx_ids
-        for i, trace in enumerate(traces):
-            assert trace.tx_id == i, (
-                f"Missing transaction: expected tx_id {i}, got {trace.tx_id}"
-            )
+        assert result.returncode == 0, (
+            f"LATENCY={latency} failed: {decode_output(result.stdout)}"
+        )
+        assert b"PASS" in result.stdout
 
     def test_shell_transparency(self):
         """Verify shell doesn't modify transaction order."""
@@ -154,37 +141,14 @@ class TestFunctionalEquivalence:
 
         assert result.returncode == 0
 
-        traces = runner.load_traces('trace_order.bin')
+        traces = runner.load_trace_array('trace_order.bin')
 
         # Verify ordering by checking ingress timestamps are increasing
-        prev_ingress = -1
-        for i, trace in enumerate(traces):
-            assert trace.t_ingress > prev_ingress, (
-                f"Transaction order violated at trace {i}"
-            )
-            prev_ingress = trace.t_ingress
-
-    def test_no_data_corruption(self):
-        """Verify metadata passes through uncorrupted."""
-        runner = build_for_latency(self.sim_dir, 3)
-
-        result = runner.run(
-            test_name='equivalence',
-            num_tx=100,
-            output_file='trace_corrupt.bin',
-            seed=self.seed
+        bad = np.flatnonzero(np.diff(traces['t_ingress'].astype(np.int64)) <= 0)
+        assert bad.size == 0, (
+            f"Transaction order violated at trace {bad[0] + 1}"
         )
 
-        assert result.returncode == 0
-
-        traces = runner.load_traces('trace_corrupt.bin')
-
-        # Verify no error flags set (would indicate corruption)
-        for i, trace in enumerate(traces):
-            assert trace.flags == 0, (
-                f"Trace {i} has unexpected flags: {trace.flags:04x}"
-            )
-
     @pytest.mark.parametrize("num_tx", [10, 100, 500])
     def test_equivalence_various_sizes(self, num_tx: int):
         """Verify equivalence for various transaction counts."""
@@ -199,5 +163,5 @@ class TestFunctionalEquivalence:
 
         assert result.returncode == 0
 
-        traces = runner.load_traces(f'trace_size_{num_tx}.bin')
+        traces = runner.load_trace_array(f'trace_size_{num_tx}.bin')
         assert len(traces) == num_tx
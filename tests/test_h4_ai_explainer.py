@@ -4,10 +4,12 @@ Tests pattern detection, fact extraction, and report generation.
 """
 
 import pytest
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, replace
+from typing import List
 import json
 
+import numpy as np
+
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -40,7 +42,7 @@ from ai.report_generator import (
 # Mock Data Classes
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockTrace:
     """Mock trace for testing."""
     tx_id: int
@@ -50,7 +52,7 @@ class MockTrace:
     flags: int = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockLatencyMetrics:
     """Mock latency metrics."""
     count: int
@@ -61,14 +63,14 @@ class MockLatencyMetrics:
     std_cycles: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockThroughputMetrics:
     """Mock throughput metrics."""
     transactions_per_second: float
     max_burst_size: int = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockAnomaly:
     """Mock anomaly."""
     tx_id: int
@@ -76,7 +78,7 @@ class MockAnomaly:
     zscore: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockAnomalyReport:
     """Mock anomaly report."""
     count: int
@@ -84,7 +86,7 @@ class MockAnomalyReport:
     anomalies: List[MockAnomaly]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MockMetrics:
     """Mock full metrics."""
     latency: MockLatencyMetrics
@@ -108,32 +110,133 @@ class MockMetrics:
         }
 
 
-def create_mock_traces(count: int, base_latency: int = 5, variance: int = 1) -> List[MockTrace]:
-    """Create mock traces with specified latency characteristics."""
-    import random
-    traces = []
-    t = 0
-    for i in range(count):
-        latency = base_latency + random.randint(-variance, variance)
-        traces.append(MockTrace(
-            tx_id=i,
-            t_ingress=t,
-            t_egress=t + latency,
-            latency_cycles=latency,
-        ))
-        t += latency + 5
-    return traces
+def create_mock_traces(
+    count: int, base_latency: int = 5, variance: int = 1, seed: int = 0
+) -> List[MockTrace]:
+    """Create mock traces with specified latency characteristics.
+
+    Latencies are drawn from a seeded NumPy generator, so every call with
+    the same arguments yields the same traces.
+    """
+    if count == 0:
+        return []
+    rng = np.random.default_rng(seed)
+    latencies = base_latency + rng.integers(-variance, variance + 1, size=count)
+    # Each transaction starts 5 cycles after the previous one completes
+    t_ingress = np.cumsum(np.concatenate(([0], latencies[:-1] + 5)))
+    t_egress = t_ingress + latencies
+    return [
+        MockTrace(tx_id=i, t_ingress=t_in, t_egress=t_out, latency_cycles=lat)
+        for i, (t_in, t_out, lat) in enumerate(
+            zip(t_ingress.tolist(), t_egress.tolist(), latencies.tolist())
+        )
+    ]
+
+
+def _with_latency(trace: MockTrace, latency: int) -> MockTrace:
+    """Return a copy of a (frozen) trace with a different latency."""
+    return replace(trace, latency_cycles=latency, t_egress=trace.t_ingress + latency)
 
 
 def create_traces_with_spike(count: int, spike_at: int, spike_latency: int) -> List[MockTrace]:
     """Create traces with a latency spike at specified index."""
     traces = create_mock_traces(count, base_latency=5, variance=1)
     if spike_at < len(traces):
-        traces[spike_at].latency_cycles = spike_latency
-        traces[spike_at].t_egress = traces[spike_at].t_ingress + spike_latency
+        traces[spike_at] = _with_latency(traces[spike_at], spike_latency)
+    return traces
+
+
+# Baseline metrics (frozen, so safe to share); tests derive variants with
+# dataclasses.replace instead of rebuilding the whole tree
+_BASE_METRICS = MockMetrics(
+    latency=MockLatencyMetrics(count=1000, p50_cycles=5, p99_cycles=10),
+    throughput=MockThroughputMetrics(transactions_per_second=10000),
+    anomalies=MockAnomalyReport(count=0, threshold_zscore=3.0, anomalies=[]),
+)
+
+
+# ============================================================================
+# Shared Fixtures
+# ============================================================================
+# Detector, extractor and generator are stateless between calls, and the
+# shared traces/metrics are never mutated, so one instance serves the module.
+
+@pytest.fixture(scope="module")
+def default_detector() -> PatternDetector:
+    return PatternDetector()
+
+
+@pytest.fixture(scope="module")
+def default_extractor() -> FactExtractor:
+    return FactExtractor()
+
+
+@pytest.fixture(scope="module")
+def default_generator() -> AIReportGenerator:
+    return AIReportGenerator()
+
+
+@pytest.fixture(scope="module")
+def normal_traces_100() -> List[MockTrace]:
+    return create_mock_traces(100)
+
+
+@pytest.fixture(scope="module")
+def normal_metrics() -> MockMetrics:
+    return replace(_BASE_METRICS, latency=replace(_BASE_METRICS.latency, count=100))
+
+
+def _spike_at_50() -> List[MockTrace]:
+    """Flat 5-cycle latency with a 10x spike at tx 50."""
+    traces = create_mock_traces(100, base_latency=5, variance=0)
+    traces[50] = _with_latency(traces[50], 50)
     return traces
 
 
+def _check_spike(patterns):
+    assert 50 in patterns[0].affected_tx_ids
+
+
+def _check_burst(patterns):
+    assert patterns[0].details['burst_size'] == 4
+
+
+def _check_kill(patterns):
+    assert patterns[0].severity == 'critical'
+    assert patterns[0].confidence == 1.0
+
+
+_RATE_LIMIT_BURST_EVENTS = {
+    'rate_limit_rejects': [
+        {'cycle': 100, 'tx_id': 10, 'tokens_remaining': 0},
+        {'cycle': 105, 'tx_id': 11, 'tokens_remaining': 0},
+        {'cycle': 110, 'tx_id': 12, 'tokens_remaining': 0},
+        {'cycle': 115, 'tx_id': 13, 'tokens_remaining': 0},
+    ]
+}
+
+_KILL_SWITCH_EVENTS = {
+    'kill_switch_triggers': [
+        {'cycle': 500, 'reason': 'pnl_threshold', 'orders_blocked': 10, 'pnl': -15000}
+    ]
+}
+
+# (traces_factory, risk_events, pattern_type, expected_count, check);
+# expected_count None means "at least one"
+# pattern_type None counts patterns of every type
+DETECTION_CASES = [
+    pytest.param(list, None, None, 0, None, id="empty"),
+    # With uniform latency, no spikes should be detected
+    pytest.param(lambda: create_mock_traces(100), None,
+                 PatternType.LATENCY_SPIKE, 0, None, id="normal"),
+    pytest.param(_spike_at_50, None, PatternType.LATENCY_SPIKE, None, _check_spike, id="spike"),
+    pytest.param(lambda: create_mock_traces(50), _RATE_LIMIT_BURST_EVENTS,
+                 PatternType.RATE_LIMIT_BURST, 1, _check_burst, id="burst"),
+    pytest.param(lambda: create_mock_traces(50), _KILL_SWITCH_EVENTS,
+                 PatternType.KILL_SWITCH_TRIGGER, 1, _check_kill, id="kill"),
+]
+
+
 # ============================================================================
 # Pattern Detector Tests
 # ============================================================================
@@ -141,12 +244,11 @@ def create_traces_with_spike(count: int, spike_at: int, spike_latency: int) -> L
 class TestPatternDetector:
     """Tests for pattern detection."""
 
-    def test_detector_initialization(self):
+    def test_detector_initialization(self, default_detector):
         """Test detector can be initialized with defaults."""
-        detector = PatternDetector()
-        assert detector.latency_zscore_threshold == 3.0
-        assert detector.burst_window_cycles == 100
-        assert detector.min_pattern_confidence == 0.7
+        assert default_detector.latency_zscore_threshold == 3.0
+        assert default_detector.burst_window_cycles == 100
+        assert default_detector.min_pattern_confidence == 0.7
 
     def test_detector_custom_config(self):
         """Test detector with custom configuration."""
@@ -158,74 +260,29 @@ class TestPatternDetector:
         assert detector.latency_zscore_threshold == 2.0
         assert detector.burst_window_cycles == 50
 
-    def test_detect_empty_traces(self):
-        """Test detection with empty trace list."""
-        detector = PatternDetector()
-        result = detector.detect_all([])
+    @pytest.mark.parametrize(
+        "traces_factory,risk_events,pattern_type,expected_count,check",
+        DETECTION_CASES,
+    )
+    def test_detect_patterns(
+        self, default_detector, traces_factory, risk_events, pattern_type, expected_count, check,
+    ):
+        """Table-driven detection: one row per trace/risk-event scenario."""
+        traces = traces_factory()
+        result = default_detector.detect_all(traces, risk_events)
         assert isinstance(result, PatternDetectionResult)
-        assert len(result.patterns) == 0
-        assert result.total_transactions == 0
-
-    def test_detect_normal_traces(self):
-        """Test detection with normal traces (no anomalies)."""
-        detector = PatternDetector()
-        traces = create_mock_traces(100, base_latency=5, variance=1)
-        result = detector.detect_all(traces)
-        # With uniform latency, no spikes should be detected
-        spike_patterns = [p for p in result.patterns if p.pattern_type == PatternType.LATENCY_SPIKE]
-        assert len(spike_patterns) == 0
-
-    def test_detect_latency_spike(self):
-        """Test detection of latency spikes."""
-        detector = PatternDetector(latency_zscore_threshold=3.0)
-        # Create traces with a significant spike
-        traces = create_mock_traces(100, base_latency=5, variance=0)
-        # Add a spike at index 50
-        traces[50].latency_cycles = 50  # 10x normal
-        traces[50].t_egress = traces[50].t_ingress + 50
-
-        result = detector.detect_all(traces)
-        spike_patterns = [p for p in result.patterns if p.pattern_type == PatternType.LATENCY_SPIKE]
-        assert len(spike_patterns) >= 1
-        # The spike should include tx_id 50
-        spike = spike_patterns[0]
-        assert 50 in spike.affected_tx_ids
-
-    def test_detect_rate_limit_burst(self):
-        """Test detection of rate limit bursts."""
-        detector = PatternDetector(burst_window_cycles=100)
-        traces = create_mock_traces(50)
-
-        risk_events = {
-            'rate_limit_rejects': [
-                {'cycle': 100, 'tx_id': 10, 'tokens_remaining': 0},
-                {'cycle': 105, 'tx_id': 11, 'tokens_remaining': 0},
-                {'cycle': 110, 'tx_id': 12, 'tokens_remaining': 0},
-                {'cycle': 115, 'tx_id': 13, 'tokens_remaining': 0},
-            ]
-        }
-
-        result = detector.detect_all(traces, risk_events)
-        burst_patterns = [p for p in result.patterns if p.pattern_type == PatternType.RATE_LIMIT_BURST]
-        assert len(burst_patterns) == 1
-        assert burst_patterns[0].details['burst_size'] == 4
-
-    def test_detect_kill_switch(self):
-        """Test detection of kill switch events."""
-        detector = PatternDetector()
-        traces = create_mock_traces(50)
-
-        risk_events = {
-            'kill_switch_triggers': [
-                {'cycle': 500, 'reason': 'pnl_threshold', 'orders_blocked': 10, 'pnl': -15000}
-            ]
-        }
-
-        result = detector.detect_all(traces, risk_events)
-        kill_patterns = [p for p in result.patterns if p.pattern_type == PatternType.KILL_SWITCH_TRIGGER]
-        assert len(kill_patterns) == 1
-        assert kill_patterns[0].severity == 'critical'
-        assert kill_patterns[0].confidence == 1.0
+        assert result.total_transactions == len(traces)
+
+        matched = [
+            p for p in result.patterns
+            if pattern_type is None or p.pattern_type == pattern_type
+        ]
+        if expected_count is None:
+            assert len(matched) >= 1
+        else:
+            assert len(matched) == expected_count
+        if check is not None:
+            check(matched)
 
     def test_pattern_to_dict(self):
         """Test pattern serialization."""
@@ -268,17 +325,12 @@ class TestFactExtractor:
         extractor = FactExtractor(clock_period_ns=10.0)
         assert extractor.clock_period_ns == 10.0
 
-    def test_extract_latency_facts(self):
+    def test_extract_latency_facts(self, default_extractor):
         """Test extraction of latency facts."""
-        extractor = FactExtractor()
-        metrics = MockMetrics(
-            latency=MockLatencyMetrics(count=1000, p50_cycles=5, p99_cycles=10),
-            throughput=MockThroughputMetrics(transactions_per_second=10000),
-            anomalies=MockAnomalyReport(count=0, threshold_zscore=3.0, anomalies=[]),
-        )
+        metrics = _BASE_METRICS
         patterns = PatternDetectionResult(patterns=[], analysis_window_cycles=1000, total_transactions=100)
 
-        facts = extractor.extract(metrics, patterns)
+        facts = default_extractor.extract(metrics, patterns)
 
         # Check latency facts were extracted
         latency_facts = [f for f in facts.facts if f.category == 'latency']
@@ -289,24 +341,19 @@ class TestFactExtractor:
         assert p50_fact is not None
         assert p50_fact.value == 5
 
-    def test_extract_anomaly_facts(self):
+    def test_extract_anomaly_facts(self, default_extractor):
         """Test extraction of anomaly facts."""
-        extractor = FactExtractor()
-        metrics = MockMetrics(
-            latency=MockLatencyMetrics(count=1000, p50_cycles=5, p99_cycles=10),
-            throughput=MockThroughputMetrics(transactions_per_second=10000),
-            anomalies=MockAnomalyReport(
-                count=5,
-                threshold_zscore=3.0,
-                anomalies=[
-                    MockAnomaly(tx_id=100, latency_cycles=50, zscore=5.0),
-                    MockAnomaly(tx_id=200, latency_cycles=40, zscore=4.0),
-                ]
-            ),
-        )
+        metrics = replace(_BASE_METRICS, anomalies=MockAnomalyReport(
+            count=5,
+            threshold_zscore=3.0,
+            anomalies=[
+                MockAnomaly(tx_id=100, latency_cycles=50, zscore=5.0),
+                MockAnomaly(tx_id=200, latency_cycles=40, zscore=4.0),
+            ]
+        ))
         patterns = PatternDetectionResult(patterns=[], analysis_window_cycles=1000, total_transactions=100)
 
-        facts = extractor.extract(metrics, patterns)
+        facts = default_extractor.extract(metrics, patterns)
 
         anomaly_facts = [f for f in facts.facts if f.category == 'anomaly']
         assert len(anomaly_facts) >= 1
@@ -315,14 +362,9 @@ class TestFactExtractor:
         assert count_fact is not None
         assert count_fact.value == 5
 
-    def test_extract_risk_facts(self):
+    def test_extract_risk_facts(self, default_extractor):
         """Test extraction of risk facts."""
-        extractor = FactExtractor()
-        metrics = MockMetrics(
-            latency=MockLatencyMetrics(count=1000, p50_cycles=5, p99_cycles=10),
-            throughput=MockThroughputMetrics(transactions_per_second=10000),
-            anomalies=MockAnomalyReport(count=0, threshold_zscore=3.0, anomalies=[]),
-        )
+        metrics = _BASE_METRICS
         patterns = PatternDetectionResult(patterns=[], analysis_window_cycles=1000, total_transactions=100)
 
         risk_stats = {
@@ -332,7 +374,7 @@ class TestFactExtractor:
             'kill_switch_triggered': True,
         }
 
-        facts = extractor.extract(metrics, patterns, risk_stats)
+        facts = default_extractor.extract(metrics, patterns, risk_stats)
 
         risk_facts = [f for f in facts.facts if f.category == 'risk']
         assert len(risk_facts) >= 2
@@ -436,10 +478,9 @@ class TestExplainer:
 class TestReportGenerator:
     """Tests for report generation."""
 
-    def test_generator_initialization(self):
+    def test_generator_initialization(self, default_generator):
         """Test generator can be initialized without API key."""
-        generator = AIReportGenerator()
-        assert generator.explainer is None
+        assert default_generator.explainer is None
 
     def test_generator_with_config(self):
         """Test generator with custom config."""
@@ -447,18 +488,12 @@ class TestReportGenerator:
         generator = AIReportGenerator(config=config)
         assert generator.config.clock_period_ns == 5.0
 
-    def test_generate_without_ai(self):
+    def test_generate_without_ai(self, default_generator, normal_traces_100, normal_metrics):
         """Test report generation without AI."""
-        generator = AIReportGenerator()
-        traces = create_mock_traces(100)
-        metrics = MockMetrics(
-            latency=MockLatencyMetrics(count=100, p50_cycles=5, p99_cycles=10),
-            throughput=MockThroughputMetrics(transactions_per_second=10000),
-            anomalies=MockAnomalyReport(count=0, threshold_zscore=3.0, anomalies=[]),
+        report = default_generator.generate_without_ai(
+            normal_traces_100, normal_metrics, trace_file="test.bin"
         )
 
-        report = generator.generate_without_ai(traces, metrics, trace_file="test.bin")
-
         assert isinstance(report, AIReport)
         assert report.trace_file == "test.bin"
         assert report.explanation is None
@@ -501,8 +536,12 @@ class TestReportGenerator:
         assert "## Metrics" in md
         assert "### Latency" in md
 
-    def test_report_to_json(self):
-        """Test report JSON generation."""
+    def test_report_to_json_is_valid(self):
+        """Test report JSON generation produces valid JSON.
+
+        Field shape is covered by test_report_to_dict; this only guards
+        the encoding step.
+        """
         report = AIReport(
             generated_at="2024-01-01T00:00:00",
             trace_file="test.bin",
@@ -512,9 +551,7 @@ class TestReportGenerator:
             explanation=None,
             executive_summary=None,
         )
-        json_str = report.to_json()
-        parsed = json.loads(json_str)
-        assert parsed['metadata']['trace_file'] == "test.bin"
+        assert isinstance(json.loads(report.to_json()), dict)
 
 
 # ============================================================================
@@ -524,41 +561,30 @@ class TestReportGenerator:
 class TestIntegration:
     """Integration tests for the full AI pipeline."""
 
-    def test_full_pipeline_without_ai(self):
+    def test_full_pipeline_without_ai(
+        self, default_detector, default_extractor, default_generator,
+        normal_traces_100, normal_metrics,
+    ):
         """Test the full pipeline from traces to report."""
-        # Create mock data
-        traces = create_mock_traces(100)
-        metrics = MockMetrics(
-            latency=MockLatencyMetrics(count=100, p50_cycles=5, p99_cycles=10),
-            throughput=MockThroughputMetrics(transactions_per_second=10000),
-            anomalies=MockAnomalyReport(count=0, threshold_zscore=3.0, anomalies=[]),
-        )
-
         # Run pipeline
-        detector = PatternDetector()
-        patterns = detector.detect_all(traces)
-
-        extractor = FactExtractor()
-        facts = extractor.extract(metrics, patterns)
-
-        generator = AIReportGenerator()
-        report = generator.generate_without_ai(traces, metrics)
+        patterns = default_detector.detect_all(normal_traces_100)
+        facts = default_extractor.extract(normal_metrics, patterns)
+        report = default_generator.generate_without_ai(normal_traces_100, normal_metrics)
 
         # Verify outputs
         assert isinstance(patterns, PatternDetectionResult)
         assert isinstance(facts, FactSet)
         assert isinstance(report, AIReport)
 
-    def test_pipeline_with_anomalies(self):
+    def test_pipeline_with_anomalies(self, default_detector, default_extractor):
         """Test pipeline with anomalous data."""
         # Create traces with a spike
         traces = create_mock_traces(100, base_latency=5, variance=0)
-        traces[50].latency_cycles = 100  # Large spike
-        traces[50].t_egress = traces[50].t_ingress + 100
+        traces[50] = _with_latency(traces[50], 100)  # Large spike
 
-        metrics = MockMetrics(
+        metrics = replace(
+            _BASE_METRICS,
             latency=MockLatencyMetrics(count=100, p50_cycles=5, p99_cycles=100),
-            throughput=MockThroughputMetrics(transactions_per_second=10000),
             anomalies=MockAnomalyReport(
                 count=1,
                 threshold_zscore=3.0,
@@ -567,28 +593,22 @@ class TestIntegration:
         )
 
         # Run pipeline
-        detector = PatternDetector()
-        patterns = detector.detect_all(traces)
+        patterns = default_detector.detect_all(traces)
 
         # Should detect the spike
         spike_patterns = [p for p in patterns.patterns if p.pattern_type == PatternType.LATENCY_SPIKE]
         assert len(spike_patterns) >= 1
 
-        extractor = FactExtractor()
-        facts = extractor.extract(metrics, patterns)
+        facts = default_extractor.extract(metrics, patterns)
 
         # Should have anomaly facts
         anomaly_facts = [f for f in facts.facts if f.category == 'anomaly']
         assert len(anomaly_facts) >= 1
 
-    def test_pipeline_with_risk_events(self):
+    def test_pipeline_with_risk_events(
+        self, default_detector, default_extractor, normal_traces_100, normal_metrics,
+    ):
         """Test pipeline with risk events."""
-        traces = create_mock_traces(100)
-        metrics = MockMetrics(
-            latency=MockLatencyMetrics(count=100, p50_cycles=5, p99_cycles=10),
-            throughput=MockThroughputMetrics(transactions_per_second=10000),
-            anomalies=MockAnomalyReport(count=0, threshold_zscore=3.0, anomalies=[]),
-        )
 
         risk_events = {
             'rate_limit_rejects': [
@@ -607,15 +627,13 @@ class TestIntegration:
             'kill_switch_triggered': True,
         }
 
-        detector = PatternDetector()
-        patterns = detector.detect_all(traces, risk_events)
+        patterns = default_detector.detect_all(normal_traces_100, risk_events)
 
         # Should detect kill switch
         kill_patterns = [p for p in patterns.patterns if p.pattern_type == PatternType.KILL_SWITCH_TRIGGER]
         assert len(kill_patterns) == 1
 
-        extractor = FactExtractor()
-        facts = extractor.extract(metrics, patterns, risk_stats)
+        facts = default_extractor.extract(normal_metrics, patterns, risk_stats)
 
         # Should have risk facts
         risk_facts = [f for f in facts.facts if f.category == 'risk']
@@ -1,11 +1,6 @@
 """Tests for H5: Risk Correlation."""
 
 import pytest
-from pathlib import Path
-from datetime import datetime
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from protocol import (
     ProtocolHealth,
@@ -17,6 +12,8 @@ from protocol import (
 )
 from ai.pattern_detector import Pattern, PatternType
 
+pytestmark = pytest.mark.xdist_group(name="h5_correlation")
+
 
 def make_health(
     protocol_id="test",
@@ -93,6 +90,29 @@ def make_pattern(
     )
 
 
+# Built once at import; the correlator only reads context events, so the
+# tuple is passed through without copying
+_MANY_EVENTS = tuple(make_event(f"evt-{i}") for i in range(20))
+
+
+@pytest.fixture(scope="module")
+def correlator():
+    """RiskCorrelator shared by the module's tests."""
+    return RiskCorrelator()
+
+
+@pytest.fixture(scope="module")
+def default_pattern():
+    """Default Pattern, shared read-only."""
+    return make_pattern()
+
+
+@pytest.fixture(scope="module")
+def default_event():
+    """Default GovernanceEvent, shared read-only."""
+    return make_event()
+
+
 class TestCorrelatedEvent:
     """Tests for CorrelatedEvent dataclass."""
 
@@ -209,18 +229,16 @@ class TestRiskCorrelator:
         correlator = RiskCorrelator()
         assert correlator is not None
 
-    def test_correlate_empty_patterns(self):
+    def test_correlate_empty_patterns(self, correlator):
         """Test correlation with no patterns."""
-        correlator = RiskCorrelator()
         context = make_context()
 
         result = correlator.correlate([], context)
 
         assert len(result.correlated_events) == 0
 
-    def test_correlate_no_events(self):
+    def test_correlate_no_events(self, correlator):
         """Test correlation with no protocol events."""
-        correlator = RiskCorrelator()
         patterns = [make_pattern()]
         context = make_context(events=[])
 
@@ -229,10 +247,8 @@ class TestRiskCorrelator:
         # Pattern may be uncorrelated if no events to correlate with
         assert result is not None
 
-    def test_correlate_kill_switch_with_treasury_event(self):
+    def test_correlate_kill_switch_with_treasury_event(self, correlator):
         """Test correlation of kill switch with treasury event."""
-        correlator = RiskCorrelator()
-
         # Kill switch pattern
         kill_pattern = make_pattern(
             pattern_type=PatternType.KILL_SWITCH_TRIGGER,
@@ -254,10 +270,8 @@ class TestRiskCorrelator:
         if result.correlated_events:
             assert result.correlated_events[0].correlation_type == "causal"
 
-    def test_correlate_latency_spike_with_high_impact_event(self):
+    def test_correlate_latency_spike_with_high_impact_event(self, correlator):
         """Test correlation of latency spike with high-impact proposal."""
-        correlator = RiskCorrelator()
-
         # Latency spike pattern
         spike_pattern = make_pattern(
             pattern_type=PatternType.LATENCY_SPIKE,
@@ -278,10 +292,8 @@ class TestRiskCorrelator:
         if result.correlated_events:
             assert result.correlated_events[0].correlation_type == "temporal"
 
-    def test_correlate_multiple_patterns(self):
+    def test_correlate_multiple_patterns(self, correlator):
         """Test correlation with multiple patterns."""
-        correlator = RiskCorrelator()
-
         patterns = [
             make_pattern(PatternType.LATENCY_SPIKE),
             make_pattern(PatternType.RATE_LIMIT_BURST),
@@ -298,29 +310,26 @@ class TestRiskCorrelator:
         # Should process without error
         assert result is not None
 
-    def test_correlation_types(self):
+    @pytest.mark.parametrize(
+        "corr_type", ["temporal", "causal", "contextual", "coincidental"]
+    )
+    def test_correlation_types(self, corr_type, default_pattern, default_event):
         """Test different correlation types are supported."""
-        valid_types = ["temporal", "causal", "contextual", "coincidental"]
-
-        # All these should be valid correlation types
-        for corr_type in valid_types:
-            correlated = CorrelatedEvent(
-                hft_pattern=make_pattern(),
-                protocol_event=make_event(),
-                correlation_type=corr_type,
-                correlation_confidence=0.5,
-                explanation="Test",
-            )
-            assert correlated.correlation_type == corr_type
+        correlated = CorrelatedEvent(
+            hft_pattern=default_pattern,
+            protocol_event=default_event,
+            correlation_type=corr_type,
+            correlation_confidence=0.5,
+            explanation="Test",
+        )
+        assert correlated.correlation_type == corr_type
 
 
 class TestRiskCorrelatorWithRiskFlags:
     """Tests for correlation with protocol risk flags."""
 
-    def test_correlate_with_high_risk_protocol(self):
+    def test_correlate_with_high_risk_protocol(self, correlator):
         """Test correlation when protocol is high risk."""
-        correlator = RiskCorrelator()
-
         health = make_health(
             risk_flags=["low_runway", "governance_stall"],
             health_tier="D",
@@ -338,10 +347,8 @@ class TestRiskCorrelatorWithRiskFlags:
         assert result.protocol_risk_during_analysis == "high"
         assert len(result.warnings) >= 1
 
-    def test_correlate_with_active_governance(self):
+    def test_correlate_with_active_governance(self, correlator):
         """Test correlation notes active governance."""
-        correlator = RiskCorrelator()
-
         health = make_health()
         health.active_proposals = 3  # Active governance
 
@@ -354,64 +361,63 @@ class TestRiskCorrelatorWithRiskFlags:
         assert result.governance_active is True
 
 
-class TestCorrelationStrength:
-    """Tests for correlation confidence calculation."""
-
-    def test_temporal_correlation_confidence(self):
-        """Test temporal correlation has appropriate confidence."""
-        correlator = RiskCorrelator()
-
-        pattern = make_pattern(PatternType.LATENCY_SPIKE)
-        event = make_event(impact_level="high")
-
-        context = make_context(events=[event])
-        result = correlator.correlate([pattern], context)
-
-        # Temporal correlations should have confidence around 0.7
-        for corr in result.correlated_events:
-            if corr.correlation_type == "temporal":
-                assert 0.5 <= corr.correlation_confidence <= 1.0
+# (pattern type, event kwargs, correlation type, minimum confidence)
+CORRELATION_STRENGTH_CASES = [
+    # Temporal correlations should have confidence around 0.7
+    pytest.param(
+        PatternType.LATENCY_SPIKE, dict(impact_level="high"), "temporal", 0.5,
+        id="temporal",
+    ),
+    # Kill switch with major treasury event: causal, higher confidence
+    pytest.param(
+        PatternType.KILL_SWITCH_TRIGGER,
+        dict(impact_level="high", treasury_impact_usd=10_000_000),
+        "causal", 0.8,
+        id="causal",
+    ),
+]
 
-    def test_causal_correlation_higher_confidence(self):
-        """Test causal correlations have higher confidence."""
-        correlator = RiskCorrelator()
 
-        # Kill switch with major treasury event
-        pattern = make_pattern(PatternType.KILL_SWITCH_TRIGGER)
-        event = make_event(
-            impact_level="high",
-            treasury_impact_usd=10_000_000,
-        )
+class TestCorrelationStrength:
+    """Tests for correlation confidence calculation."""
 
-        context = make_context(events=[event])
-        result = correlator.correlate([pattern], context)
+    @pytest.mark.parametrize(
+        "pattern_type,event_kw,corr_type,min_confidence", CORRELATION_STRENGTH_CASES
+    )
+    def test_correlation_confidence(self, correlator, pattern_type, event_kw, corr_type, min_confidence):
+        """Test each correlation type carries an appropriate confidence."""
+        context = make_context(events=[make_event(**event_kw)])
+        result = correlator.correlate([make_pattern(pattern_type)], context)
 
-        # Causal correlations should have higher confidence
         for corr in result.correlated_events:
-            if corr.correlation_type == "causal":
-                assert corr.correlation_confidence >= 0.8
+            if corr.correlation_type == corr_type:
+                assert min_confidence <= corr.correlation_confidence <= 1.0
 
 
 class TestCorrelatorEdgeCases:
     """Edge case tests for RiskCorrelator."""
 
-    def test_correlate_with_many_events(self):
-        """Test correlation with many events."""
-        correlator = RiskCorrelator()
-
-        patterns = [make_pattern()]
-        events = [make_event(f"evt-{i}") for i in range(20)]
-
-        context = make_context(events=events)
-        result = correlator.correlate(patterns, context)
-
-        # Should handle many events without issue
+    @pytest.mark.parametrize("pattern_kw,context_kw", [
+        # Many events: should be handled without issue
+        pytest.param(
+            {}, dict(events=_MANY_EVENTS),
+            id="many-events",
+        ),
+        # Critical pattern, high-risk protocol, no events: may or may not
+        # yield a contextual correlation depending on implementation
+        pytest.param(
+            dict(severity="critical"),
+            dict(health=make_health(risk_level="critical", risk_flags=["emergency"]), events=[]),
+            id="critical-pattern-no-events",
+        ),
+    ])
+    def test_correlate_edge_inputs(self, correlator, pattern_kw, context_kw):
+        """Test correlation completes for unusual pattern/context inputs."""
+        result = correlator.correlate([make_pattern(**pattern_kw)], make_context(**context_kw))
         assert result is not None
 
-    def test_correlate_preserves_pattern_details(self):
+    def test_correlate_preserves_pattern_details(self, correlator):
         """Test that correlation preserves pattern details."""
-        correlator = RiskCorrelator()
-
         pattern = Pattern(
             pattern_type=PatternType.LATENCY_SPIKE,
             confidence=0.95,
@@ -432,27 +438,3 @@ class TestCorrelatorEdgeCases:
             corr = result.correlated_events[0]
             assert corr.hft_pattern.start_cycle == 5000
             assert corr.hft_pattern.details["zscore"] == 5.5
-
-    def test_contextual_correlation_with_critical_pattern(self):
-        """Test contextual correlation with high-severity pattern and high-risk protocol."""
-        correlator = RiskCorrelator()
-
-        # Critical pattern
-        pattern = make_pattern(severity="critical")
-
-        # High-risk protocol with no events
-        health = make_health(
-            risk_level="critical",
-            risk_flags=["emergency"],
-        )
-
-        context = make_context(health=health, events=[])
-        result = correlator.correlate([pattern], context)
-
-        # Should create contextual correlation
-        has_contextual = any(
-            c.correlation_type == "contextual"
-            for c in result.correlated_events
-        )
-        # May or may not have contextual correlation depending on implementation
-        assert result is not None
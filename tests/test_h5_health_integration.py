@@ -1,10 +1,6 @@
 """Tests for H5: Health Integration."""
 
 import pytest
-from pathlib import Path
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from protocol import (
     ProtocolHealth,
@@ -12,6 +8,8 @@ from protocol import (
     HealthIntegrator,
 )
 
+pytestmark = pytest.mark.xdist_group(name="h5_health_integration")
+
 
 def make_health(
     health_tier="B",
@@ -66,6 +64,12 @@ def make_hft_metrics(
     }
 
 
+@pytest.fixture(scope="module")
+def integrator():
+    """HealthIntegrator shared by the module's tests."""
+    return HealthIntegrator()
+
+
 class TestTradingRiskAssessment:
     """Tests for TradingRiskAssessment dataclass."""
 
@@ -116,10 +120,8 @@ class TestHealthIntegrator:
         integrator = HealthIntegrator()
         assert integrator is not None
 
-    def test_assess_healthy_system(self):
+    def test_assess_healthy_system(self, integrator):
         """Test assessment of healthy HFT + healthy protocol."""
-        integrator = HealthIntegrator()
-
         metrics = make_hft_metrics(
             p50_cycles=5,
             p99_cycles=8,
@@ -137,10 +139,8 @@ class TestHealthIntegrator:
         assert result.hft_health == "healthy"
         assert result.combined_risk in ("low", "medium")
 
-    def test_assess_degraded_hft(self):
+    def test_assess_degraded_hft(self, integrator):
         """Test assessment of degraded HFT system."""
-        integrator = HealthIntegrator()
-
         # High latency, some anomalies
         metrics = make_hft_metrics(
             p50_cycles=50,
@@ -155,10 +155,8 @@ class TestHealthIntegrator:
         assert result.hft_health in ("degraded", "critical")
         assert result.combined_risk in ("medium", "high", "critical")
 
-    def test_assess_weak_protocol(self):
+    def test_assess_weak_protocol(self, integrator):
         """Test assessment with weak protocol health."""
-        integrator = HealthIntegrator()
-
         metrics = make_hft_metrics(
             p50_cycles=5,
             p99_cycles=8,
@@ -176,10 +174,8 @@ class TestHealthIntegrator:
         assert result.protocol_health == "D"
         assert result.combined_risk in ("medium", "high", "critical")
 
-    def test_assess_both_weak(self):
+    def test_assess_both_weak(self, integrator):
         """Test assessment when both HFT and protocol are weak."""
-        integrator = HealthIntegrator()
-
         # Degraded HFT
         metrics = make_hft_metrics(
             p99_cycles=50,
@@ -199,10 +195,8 @@ class TestHealthIntegrator:
         # Should be high or critical risk
         assert result.combined_risk in ("high", "critical")
 
-    def test_assess_with_governance_activity(self):
+    def test_assess_with_governance_activity(self, integrator):
         """Test assessment considers governance activity."""
-        integrator = HealthIntegrator()
-
         metrics = make_hft_metrics(p50_cycles=5, p99_cycles=8)
 
         # Active governance with low participation (triggers governance_risk)
@@ -218,51 +212,46 @@ class TestHealthIntegrator:
         assert result.governance_risk is True
 
 
-class TestHealthIntegratorRiskMatrix:
-    """Tests for risk matrix calculations."""
-
-    def test_healthy_hft_a_tier_protocol(self):
-        """Test: Healthy HFT + A-tier protocol = Low risk."""
-        integrator = HealthIntegrator()
+# (hft metrics kwargs, protocol health kwargs, acceptable combined risks)
+RISK_MATRIX_CASES = [
+    pytest.param(
+        dict(p50_cycles=5, p99_cycles=8),
+        dict(health_tier="A", overall_score=90, runway_months=60),
+        {"low"},
+        id="healthy-hft-a-tier",
+    ),
+    # C-tier adds 1 to score, so combined may be low or medium
+    pytest.param(
+        dict(p50_cycles=5, p99_cycles=8),
+        dict(health_tier="C", overall_score=55),
+        {"low", "medium"},
+        id="healthy-hft-c-tier",
+    ),
+    # p99 above the default threshold of 10, anomalies above the default of 5
+    pytest.param(
+        dict(p99_cycles=50, anomaly_count=10),
+        dict(health_tier="B"),
+        {"medium", "high"},
+        id="degraded-hft-b-tier",
+    ),
+]
 
-        metrics = make_hft_metrics(p50_cycles=5, p99_cycles=8)
-        health = make_health(health_tier="A", overall_score=90, runway_months=60)
 
-        result = integrator.assess(metrics, health)
-        assert result.combined_risk == "low"
-
-    def test_healthy_hft_c_tier_protocol(self):
-        """Test: Healthy HFT + C-tier protocol."""
-        integrator = HealthIntegrator()
-
-        metrics = make_hft_metrics(p50_cycles=5, p99_cycles=8)
-        health = make_health(health_tier="C", overall_score=55)
-
-        result = integrator.assess(metrics, health)
-        # C-tier adds 1 to score, so combined may be low or medium
-        assert result.combined_risk in ("low", "medium")
-
-    def test_degraded_hft_b_tier_protocol(self):
-        """Test: Degraded HFT + B-tier protocol."""
-        integrator = HealthIntegrator()
-
-        metrics = make_hft_metrics(
-            p99_cycles=50,  # Above default threshold of 10
-            anomaly_count=10,  # Above default threshold of 5
-        )
-        health = make_health(health_tier="B")
+class TestHealthIntegratorRiskMatrix:
+    """Tests for risk matrix calculations."""
 
-        result = integrator.assess(metrics, health)
-        assert result.combined_risk in ("medium", "high")
+    @pytest.mark.parametrize("m_kw,h_kw,expected", RISK_MATRIX_CASES)
+    def test_risk_matrix(self, integrator, m_kw, h_kw, expected):
+        """Test combined risk for each HFT state x protocol tier pairing."""
+        result = integrator.assess(make_hft_metrics(**m_kw), make_health(**h_kw))
+        assert result.combined_risk in expected
 
 
 class TestHealthIntegratorRecommendations:
     """Tests for recommendation generation."""
 
-    def test_low_risk_recommendation(self):
+    def test_low_risk_recommendation(self, integrator):
         """Test recommendation for low risk."""
-        integrator = HealthIntegrator()
-
         metrics = make_hft_metrics(p50_cycles=5, p99_cycles=8)
         health = make_health(health_tier="A", overall_score=90)
 
@@ -272,10 +261,8 @@ class TestHealthIntegratorRecommendations:
         assert result.recommendation is not None
         assert len(result.recommendation) > 0
 
-    def test_high_risk_recommendation(self):
+    def test_high_risk_recommendation(self, integrator):
         """Test recommendation for high risk."""
-        integrator = HealthIntegrator()
-
         metrics = make_hft_metrics(
             p99_cycles=50,
             anomaly_count=10,
@@ -296,43 +283,18 @@ class TestHealthIntegratorRecommendations:
 class TestHealthIntegratorEdgeCases:
     """Edge case tests for HealthIntegrator."""
 
-    def test_empty_metrics(self):
-        """Test handling of minimal metrics."""
-        integrator = HealthIntegrator()
-
-        metrics = {}
-        health = make_health()
-
-        result = integrator.assess(metrics, health)
-        assert result is not None
-
-    def test_missing_latency_data(self):
-        """Test handling of missing latency data."""
-        integrator = HealthIntegrator()
-
-        metrics = {"risk": {"kill_switch_triggered": False}}
-        health = make_health()
-
-        result = integrator.assess(metrics, health)
-        assert result is not None
-
-    def test_zero_values(self):
-        """Test handling of zero values."""
-        integrator = HealthIntegrator()
-
-        metrics = make_hft_metrics(
-            p50_cycles=0,
-            p99_cycles=0,
-        )
-        health = make_health()
-
-        result = integrator.assess(metrics, health)
+    @pytest.mark.parametrize("metrics", [
+        pytest.param({}, id="empty-metrics"),
+        pytest.param({"risk": {"kill_switch_triggered": False}}, id="missing-latency"),
+        pytest.param(make_hft_metrics(p50_cycles=0, p99_cycles=0), id="zero-values"),
+    ])
+    def test_sparse_metrics(self, integrator, metrics):
+        """Test handling of minimal, partial and zero-valued metrics."""
+        result = integrator.assess(metrics, make_health())
         assert result is not None
 
-    def test_extreme_latency(self):
+    def test_extreme_latency(self, integrator):
         """Test handling of extreme latency values."""
-        integrator = HealthIntegrator()
-
         metrics = make_hft_metrics(
             p50_cycles=10000,
             p99_cycles=100000,
@@ -343,10 +305,8 @@ class TestHealthIntegratorEdgeCases:
         # Should detect as degraded or critical
         assert result.hft_health in ("degraded", "critical")
 
-    def test_f_tier_protocol(self):
+    def test_f_tier_protocol(self, integrator):
         """Test handling of F-tier protocol."""
-        integrator = HealthIntegrator()
-
         metrics = make_hft_metrics(p50_cycles=5, p99_cycles=8)
         health = make_health(
             health_tier="F",
@@ -359,25 +319,23 @@ class TestHealthIntegratorEdgeCases:
         # Should be high risk due to protocol
         assert result.combined_risk in ("high", "critical")
 
-    def test_none_protocol_health(self):
+    def test_none_protocol_health(self, integrator):
         """Test handling of None protocol health."""
-        integrator = HealthIntegrator()
-
         metrics = make_hft_metrics(p50_cycles=5, p99_cycles=8)
 
         result = integrator.assess(metrics, None)
 
         assert result is not None
         assert result.protocol_health == "unknown"
+        # The shared integrator must carry no state between assessments
+        assert vars(integrator) == vars(HealthIntegrator())
 
 
 class TestHealthIntegratorIntegration:
     """Integration tests for HealthIntegrator with real scenarios."""
 
-    def test_normal_trading_day(self):
+    def test_normal_trading_day(self, integrator):
         """Test typical healthy trading scenario."""
-        integrator = HealthIntegrator()
-
         metrics = make_hft_metrics(
             p50_cycles=5,
             p99_cycles=8,
@@ -397,10 +355,8 @@ class TestHealthIntegratorIntegration:
         assert result.hft_health == "healthy"
         assert result.combined_risk == "low"
 
-    def test_market_stress_scenario(self):
+    def test_market_stress_scenario(self, integrator):
         """Test scenario with market stress indicators."""
-        integrator = HealthIntegrator()
-
         # High activity, some anomalies
         metrics = make_hft_metrics(
             p50_cycles=50,
@@ -419,10 +375,8 @@ class TestHealthIntegratorIntegration:
         # Should show elevated risk
         assert result.combined_risk in ("medium", "high", "critical")
 
-    def test_protocol_crisis_scenario(self):
+    def test_protocol_crisis_scenario(self, integrator):
         """Test scenario with protocol in crisis."""
-        integrator = HealthIntegrator()
-
         metrics = make_hft_metrics(p50_cycles=5, p99_cycles=8)  # HFT is fine
 
         health = make_health(
@@ -1,12 +1,6 @@
 """Tests for H5: Protocol Context Provider."""
 
-import pytest
-import json
 from pathlib import Path
-from datetime import datetime
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from protocol import (
     ProtocolHealth,
@@ -15,6 +9,28 @@ from protocol import (
     ProtocolContextProvider,
 )
 
+_HEALTH_DEFAULTS = {
+    "protocol_id": "test",
+    "protocol_name": "Test Protocol",
+    "overall_score": 75,
+    "health_tier": "B",
+    "treasury_usd": 100_000_000,
+    "burn_rate_monthly": 2_000_000,
+    "runway_months": 50.0,
+    "active_proposals": 1,
+    "governance_participation": 0.10,
+    "recent_votes": 3,
+    "risk_level": "low",
+    "fetched_at": "2024-01-15T10:00:00",
+    "data_staleness_hours": 0,
+}
+
+
+def make_health(**overrides):
+    """Helper to create ProtocolHealth from baseline field values."""
+    overrides.setdefault("risk_flags", [])
+    return ProtocolHealth(**{**_HEALTH_DEFAULTS, **overrides})
+
 
 class TestProtocolHealth:
     """Tests for ProtocolHealth dataclass."""
@@ -71,43 +87,16 @@ class TestProtocolHealth:
     def test_health_tier_boundaries(self):
         """Test health tier determination."""
         # A-tier: 80+
-        health_a = ProtocolHealth(
-            protocol_id="test", protocol_name="Test", overall_score=80,
-            health_tier="A", treasury_usd=0, burn_rate_monthly=0,
-            runway_months=0, active_proposals=0, governance_participation=0,
-            recent_votes=0, risk_flags=[], risk_level="low",
-            fetched_at="2024-01-15T10:00:00", data_staleness_hours=0,
-        )
+        health_a = make_health(overall_score=80, health_tier="A")
         assert health_a.health_tier == "A"
 
         # B-tier: 60-79
-        health_b = ProtocolHealth(
-            protocol_id="test", protocol_name="Test", overall_score=65,
-            health_tier="B", treasury_usd=0, burn_rate_monthly=0,
-            runway_months=0, active_proposals=0, governance_participation=0,
-            recent_votes=0, risk_flags=[], risk_level="low",
-            fetched_at="2024-01-15T10:00:00", data_staleness_hours=0,
-        )
+        health_b = make_health(overall_score=65, health_tier="B")
         assert health_b.health_tier == "B"
 
     def test_to_summary(self):
         """Test to_summary method."""
-        health = ProtocolHealth(
-            protocol_id="test",
-            protocol_name="Test Protocol",
-            overall_score=75,
-            health_tier="B",
-            treasury_usd=100_000_000,
-            burn_rate_monthly=2_000_000,
-            runway_months=50.0,
-            active_proposals=1,
-            governance_participation=0.10,
-            recent_votes=3,
-            risk_flags=[],
-            risk_level="low",
-            fetched_at="2024-01-15T10:00:00",
-            data_staleness_hours=0,
-        )
+        health = make_health()
 
         summary = health.to_summary()
         assert "Test Protocol" in summary
@@ -168,7 +157,7 @@ class TestProtocolContext:
 
     def test_create_protocol_context(self):
         """Test creation of ProtocolContext with health and events."""
-        health = ProtocolHealth(
+        health = make_health(
             protocol_id="arbitrum",
             protocol_name="Arbitrum One",
             overall_score=85,
@@ -179,10 +168,6 @@ class TestProtocolContext:
             active_proposals=2,
             governance_participation=0.12,
             recent_votes=5,
-            risk_flags=[],
-            risk_level="low",
-            fetched_at="2024-01-15T10:00:00",
-            data_staleness_hours=0,
         )
 
         events = [
@@ -209,13 +194,14 @@ class TestProtocolContext:
 
     def test_to_dict(self):
         """Test ProtocolContext serialization."""
-        health = ProtocolHealth(
-            protocol_id="optimism", protocol_name="Optimism",
-            overall_score=78, health_tier="B", treasury_usd=800_000_000,
-            burn_rate_monthly=2_200_000, runway_months=36.0,
-            active_proposals=1, governance_participation=0.08, recent_votes=3,
-            risk_flags=[], risk_level="low",
-            fetched_at="2024-01-15T10:00:00", data_staleness_hours=0,
+        health = make_health(
+            protocol_id="optimism",
+            protocol_name="Optimism",
+            overall_score=78,
+            treasury_usd=800_000_000,
+            burn_rate_monthly=2_200_000,
+            runway_months=36.0,
+            governance_participation=0.08,
         )
 
         context = ProtocolContext(
@@ -232,13 +218,7 @@ class TestProtocolContext:
 
     def test_has_active_governance(self):
         """Test has_active_governance method."""
-        health_active = ProtocolHealth(
-            protocol_id="test", protocol_name="Test", overall_score=75,
-            health_tier="B", treasury_usd=100_000_000, burn_rate_monthly=2_000_000,
-            runway_months=50.0, active_proposals=2, governance_participation=0.10,
-            recent_votes=3, risk_flags=[], risk_level="low",
-            fetched_at="2024-01-15T10:00:00", data_staleness_hours=0,
-        )
+        health_active = make_health(active_proposals=2)
 
         context = ProtocolContext(
             health=health_active,
@@ -251,12 +231,17 @@ class TestProtocolContext:
 
     def test_has_risk_flags(self):
         """Test has_risk_flags method."""
-        health_risky = ProtocolHealth(
-            protocol_id="test", protocol_name="Test", overall_score=40,
-            health_tier="D", treasury_usd=10_000_000, burn_rate_monthly=5_000_000,
-            runway_months=2.0, active_proposals=0, governance_participation=0.01,
-            recent_votes=0, risk_flags=["low_runway", "low_participation"],
-            risk_level="high", fetched_at="2024-01-15T10:00:00", data_staleness_hours=0,
+        health_risky = make_health(
+            overall_score=40,
+            health_tier="D",
+            treasury_usd=10_000_000,
+            burn_rate_monthly=5_000_000,
+            runway_months=2.0,
+            active_proposals=0,
+            governance_participation=0.01,
+            recent_votes=0,
+            risk_flags=["low_runway", "low_participation"],
+            risk_level="high",
         )
 
         context = ProtocolContext(
@@ -308,6 +293,25 @@ class TestProtocolContextProvider:
         assert context.health.health_tier == "C"
         assert "unknown_protocol" in context.health.risk_flags
 
+    def test_static_config_contexts_are_independent(self):
+        """Test cached config loads still hand out independent contexts."""
+        provider = ProtocolContextProvider(sentinel_path=None)
+        first = provider.get_context("unknown_protocol")
+        first.health.risk_flags.append("mutated")
+        first.warnings.append("mutated")
+
+        second = provider.get_context("unknown_protocol")
+        assert "mutated" not in second.health.risk_flags
+        assert "mutated" not in second.warnings
+
+    def test_context_dataclasses_use_slots(self):
+        """Test provider-built contexts carry no per-instance __dict__."""
+        provider = ProtocolContextProvider(sentinel_path=None)
+        context = provider.get_context("arbitrum")
+
+        for obj in (context, context.health, *context.recent_events):
+            assert not hasattr(obj, "__dict__")
+
     def test_list_available_static_configs(self):
         """Test that static configs exist."""
         configs_dir = Path(__file__).parent.parent / 'protocol' / 'configs'
@@ -321,7 +325,7 @@ class TestProtocolHealthRiskFlags:
 
     def test_with_risk_flags(self):
         """Test ProtocolHealth with risk flags."""
-        health = ProtocolHealth(
+        health = make_health(
             protocol_id="risky",
             protocol_name="Risky Protocol",
             overall_score=45,
@@ -334,8 +338,6 @@ class TestProtocolHealthRiskFlags:
             recent_votes=0,
             risk_flags=["low_runway", "low_participation", "governance_stall"],
             risk_level="high",
-            fetched_at="2024-01-15T10:00:00",
-            data_staleness_hours=0,
         )
 
         assert len(health.risk_flags) == 3
@@ -344,21 +346,10 @@ class TestProtocolHealthRiskFlags:
 
     def test_runway_calculation(self):
         """Test runway months calculation."""
-        health = ProtocolHealth(
-            protocol_id="test",
-            protocol_name="Test",
-            overall_score=70,
-            health_tier="B",
+        health = make_health(
             treasury_usd=100_000_000,
             burn_rate_monthly=5_000_000,
             runway_months=20.0,  # 100M / 5M = 20 months
-            active_proposals=0,
-            governance_participation=0,
-            recent_votes=0,
-            risk_flags=[],
-            risk_level="low",
-            fetched_at="2024-01-15T10:00:00",
-            data_staleness_hours=0,
         )
 
         # Verify runway calculation
@@ -3,55 +3,69 @@ Tests for Phase 10: CLI.
 
 CRITICAL TESTS:
 1. test_version - Version command works
-2. test_regression_pass - Regression pass/fail logic
+2. test_regression - Regression pass/fail logic
 3. test_demo_creates_files - Demo creates expected files
 """
 
 import pytest
 import json
-import struct
 from pathlib import Path
 
+import numpy as np
+
 # Skip all tests if typer not available
 pytest.importorskip("typer")
 
 from typer.testing import CliRunner
-from sentinel_hft.cli.main import app
 from sentinel_hft.formats.file_header import FileHeader
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner():
     return CliRunner()
 
 
-@pytest.fixture
-def sample_trace_file(tmp_path):
-    """Create a sample trace file for testing."""
-    trace_file = tmp_path / "test_traces.bin"
-
-    # Write header
-    header = FileHeader(version=1, record_size=48, clock_mhz=100)
-
-    with open(trace_file, 'wb') as f:
-        f.write(header.encode())
-
-        # Write 100 traces
-        for i in range(100):
-            record = struct.pack(
-                '<BBHIQQQHH',
-                1,  # version
-                1,  # record_type
-                0,  # core_id
-                i,  # seq_no
-                i * 100,  # t_ingress
-                i * 100 + 10 + (i % 5),  # t_egress
-                0,  # data
-                0,  # flags
-                i,  # tx_id
-            )
-            record += b'\x00' * (48 - len(record))
-            f.write(record)
+@pytest.fixture(scope="session")
+def app():
+    """The Typer app, imported on first use rather than at collection."""
+    from sentinel_hft.cli.main import app
+    return app
+
+
+# v1.2 record layout ('<BBHIQQQHH' followed by zero padding to 48 bytes)
+RECORD_DTYPE = np.dtype([
+    ('version', 'u1'),
+    ('record_type', 'u1'),
+    ('core_id', '<u2'),
+    ('seq_no', '<u4'),
+    ('t_ingress', '<u8'),
+    ('t_egress', '<u8'),
+    ('data', '<u8'),
+    ('flags', '<u2'),
+    ('tx_id', '<u2'),
+    ('pad', 'V12'),
+])
+assert RECORD_DTYPE.itemsize == 48
+
+_HEADER_BYTES = FileHeader(version=1, record_size=48, clock_mhz=100).encode()
+
+
+@pytest.fixture(scope="session")
+def sample_trace_file(tmp_path_factory):
+    """Create a sample trace file, shared read-only by all tests."""
+    trace_file = tmp_path_factory.mktemp("traces") / "test_traces.bin"
+
+    # 100 traces, filled column-wise and written in one go
+    idx = np.arange(100)
+    records = np.zeros(len(idx), dtype=RECORD_DTYPE)
+    records['version'] = 1
+    records['record_type'] = 1
+    records['seq_no'] = idx
+    records['t_ingress'] = idx * 100
+    records['t_egress'] = records['t_ingress'] + 10 + idx % 5
+    records['tx_id'] = idx
+
+    trace_file.write_bytes(_HEADER_BYTES + records.tobytes())
 
     return trace_file
 
@@ -59,7 +73,7 @@ def sample_trace_file(tmp_path):
 class TestVersion:
     """Test version command."""
 
-    def test_version(self, runner):
+    def test_version(self, runner, app):
         """Version command shows version."""
         result = runner.invoke(app, ["version"])
         assert result.exit_code == 0
@@ -69,14 +83,14 @@ class TestVersion:
 class TestConfig:
     """Test config commands."""
 
-    def test_config_init(self, runner):
+    def test_config_init(self, runner, app):
         """Config init generates valid YAML."""
         result = runner.invoke(app, ["config", "init"])
         assert result.exit_code == 0
         assert "clock:" in result.stdout
         assert "frequency_mhz:" in result.stdout
 
-    def test_config_validate_valid(self, runner, tmp_path):
+    def test_config_validate_valid(self, runner, app, tmp_path):
         """Config validate passes for valid config."""
         config = tmp_path / "valid.yml"
         config.write_text("version: 1\nclock:\n  frequency_mhz: 100")
@@ -85,7 +99,7 @@ class TestConfig:
         assert result.exit_code == 0
         assert "Valid" in result.stdout
 
-    def test_config_validate_missing_file(self, runner):
+    def test_config_validate_missing_file(self, runner, app):
         """Config validate fails for missing file."""
         result = runner.invoke(app, ["config", "validate", "/nonexistent/file.yml"])
         assert result.exit_code == 1
@@ -94,7 +108,7 @@ class TestConfig:
 class TestAnalyze:
     """Test analyze command."""
 
-    def test_analyze_json_output(self, runner, sample_trace_file, tmp_path):
+    def test_analyze_json_output(self, runner, app, sample_trace_file, tmp_path):
         """Analyze produces JSON output."""
         output = tmp_path / "report.json"
 
@@ -111,7 +125,7 @@ class TestAnalyze:
         assert 'latency' in report
         assert report['latency']['count'] == 100
 
-    def test_analyze_table_output(self, runner, sample_trace_file):
+    def test_analyze_table_output(self, runner, app, sample_trace_file):
         """Analyze produces table output."""
         result = runner.invoke(app, [
             "analyze", str(sample_trace_file),
@@ -123,70 +137,54 @@ class TestAnalyze:
         assert "P99" in result.stdout
 
 
-class TestRegression:
-    """Test regression command."""
+def _metrics(p99_cycles=10, total_drops=0):
+    """Minimal analyze-report metrics for the regression command."""
+    return {"latency": {"p99_cycles": p99_cycles}, "drops": {"total_drops": total_drops}}
 
-    def test_regression_pass(self, runner, tmp_path):
-        """
-        CRITICAL TEST: Regression pass when within threshold.
-        """
-        metrics = {"latency": {"p99_cycles": 10}, "drops": {"total_drops": 0}}
 
-        current = tmp_path / "current.json"
-        baseline = tmp_path / "baseline.json"
-        current.write_text(json.dumps(metrics))
-        baseline.write_text(json.dumps(metrics))
+# (current metrics, baseline metrics, extra args, expected exit, expected stdout substring)
+REGRESSION_CASES = [
+    pytest.param(_metrics(), _metrics(), [], 0, "PASSED", id="pass"),
+    pytest.param(_metrics(p99_cycles=100), _metrics(), [], 1, "FAILED", id="fail_p99"),
+    # 20% regression with 25% threshold - should pass
+    pytest.param(
+        _metrics(p99_cycles=12), _metrics(), ["--max-p99-regression", "25"], 0, None,
+        id="custom_threshold",
+    ),
+    pytest.param(
+        _metrics(total_drops=5), _metrics(), ["--fail-on-drops"], 1, "traces dropped",
+        id="fail_on_drops",
+    ),
+]
 
-        result = runner.invoke(app, ["regression", str(current), str(baseline)])
-        assert result.exit_code == 0
-        assert "PASSED" in result.stdout
 
-    def test_regression_fail_p99(self, runner, tmp_path):
-        """Regression fails when P99 exceeds threshold."""
-        current = tmp_path / "current.json"
-        baseline = tmp_path / "baseline.json"
-        current.write_text(json.dumps({"latency": {"p99_cycles": 100}, "drops": {"total_drops": 0}}))
-        baseline.write_text(json.dumps({"latency": {"p99_cycles": 10}, "drops": {"total_drops": 0}}))
-
-        result = runner.invoke(app, ["regression", str(current), str(baseline)])
-        assert result.exit_code == 1
-        assert "FAILED" in result.stdout
-
-    def test_regression_custom_threshold(self, runner, tmp_path):
-        """Regression uses custom threshold."""
-        current = tmp_path / "current.json"
-        baseline = tmp_path / "baseline.json"
-        current.write_text(json.dumps({"latency": {"p99_cycles": 12}, "drops": {"total_drops": 0}}))
-        baseline.write_text(json.dumps({"latency": {"p99_cycles": 10}, "drops": {"total_drops": 0}}))
-
-        # 20% regression with 25% threshold - should pass
-        result = runner.invoke(app, [
-            "regression", str(current), str(baseline),
-            "--max-p99-regression", "25"
-        ])
-        assert result.exit_code == 0
+class TestRegression:
+    """Test regression command."""
 
-    def test_regression_fail_on_drops(self, runner, tmp_path):
-        """Regression fails when drops detected with --fail-on-drops."""
+    @pytest.mark.parametrize("current_metrics,baseline_metrics,extra_args,expected_exit,expected_text",
+                             REGRESSION_CASES)
+    def test_regression(self, runner, app, tmp_path, current_metrics, baseline_metrics,
+                        extra_args, expected_exit, expected_text):
+        """
+        CRITICAL TEST: Regression pass/fail against threshold and drop checks.
+        """
         current = tmp_path / "current.json"
         baseline = tmp_path / "baseline.json"
-        current.write_text(json.dumps({"latency": {"p99_cycles": 10}, "drops": {"total_drops": 5}}))
-        baseline.write_text(json.dumps({"latency": {"p99_cycles": 10}, "drops": {"total_drops": 0}}))
+        current.write_text(json.dumps(current_metrics))
+        baseline.write_text(json.dumps(baseline_metrics))
 
-        result = runner.invoke(app, [
-            "regression", str(current), str(baseline),
-            "--fail-on-drops"
-        ])
-        assert result.exit_code == 1
-        assert "dropped" in result.stdout.lower()
+        result = runner.invoke(app, ["regression", str(current), str(baseline), *extra_args])
+        assert result.exit_code == expected_exit
+        if expected_text is not None:
+            assert expected_text in result.stdout
 
-    def test_regression_output_file(self, runner, tmp_path):
+    def test_regression_output_file(self, runner, app, tmp_path):
         """Regression writes diff to output file."""
         current = tmp_path / "current.json"
         baseline = tmp_path / "baseline.json"
         output = tmp_path / "diff.json"
-        current.write_text(json.dumps({"latency": {"p99_cycles": 10}, "drops": {"total_drops": 0}}))
-        baseline.write_text(json.dumps({"latency": {"p99_cycles": 10}, "drops": {"total_drops": 0}}))
+        current.write_text(json.dumps(_metrics()))
+        baseline.write_text(json.dumps(_metrics()))
 
         result = runner.invoke(app, [
             "regression", str(current), str(baseline),
@@ -201,25 +199,29 @@ class TestRegression:
         assert diff['p99']['change_percent'] == 0.0
 
 
+@pytest.fixture(scope="module")
+def demo_output(runner, app, tmp_path_factory):
+    """Run the demo command once and share its output directory."""
+    out_dir = tmp_path_factory.mktemp("demo")
+    result = runner.invoke(app, ["demo", "-o", str(out_dir)])
+    assert result.exit_code == 0
+    return out_dir
+
+
 class TestDemo:
     """Test demo command."""
 
-    def test_demo_creates_files(self, runner, tmp_path):
+    def test_demo_creates_files(self, demo_output):
         """
         CRITICAL TEST: Demo creates expected files.
         """
-        result = runner.invoke(app, ["demo", "-o", str(tmp_path)])
-
-        assert result.exit_code == 0
-        assert (tmp_path / "demo_traces_v11.bin").exists()
-        assert (tmp_path / "demo_traces_v12.bin").exists()
-        assert (tmp_path / "demo_report_v11.json").exists()
+        assert (demo_output / "demo_traces_v11.bin").exists()
+        assert (demo_output / "demo_traces_v12.bin").exists()
+        assert (demo_output / "demo_report_v11.json").exists()
 
-    def test_demo_report_valid(self, runner, tmp_path):
+    def test_demo_report_valid(self, demo_output):
         """Demo report is valid JSON."""
-        runner.invoke(app, ["demo", "-o", str(tmp_path)])
-
-        report = json.loads((tmp_path / "demo_report_v11.json").read_text())
+        report = json.loads((demo_output / "demo_report_v11.json").read_text())
 
         assert 'latency' in report
         assert report['latency']['count'] == 10000
@@ -229,7 +231,7 @@ class TestDemo:
 class TestLive:
     """Test live command."""
 
-    def test_live_requires_source(self, runner):
+    def test_live_requires_source(self, runner, app):
         """Live requires --watch or --udp-port."""
         result = runner.invoke(app, ["live"])
         assert result.exit_code == 1
@@ -19,7 +19,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sentinel_hft.formats.file_header import FileHeader, HEADER_SIZE, MAGIC
 from sentinel_hft.formats.record_types import RecordType
-from sentinel_hft.formats.reader import TraceReader, TraceFile
+from sentinel_hft.formats.reader import TraceReader, TraceFile, MMAP_THRESHOLD
 from sentinel_hft.adapters import auto_detect, SentinelV10Adapter, SentinelV11Adapter
 from sentinel_hft.adapters.base import StandardTrace
 
@@ -81,6 +81,15 @@ class TestFileHeader:
         probed = FileHeader.probe(test_file)
         assert probed is None
 
+    def test_probe_missing_or_truncated(self, tmp_path):
+        """probe() returns None for missing files and partial headers."""
+        assert FileHeader.probe(tmp_path / "missing.bin") is None
+        assert FileHeader.probe(tmp_path) is None
+
+        truncated = tmp_path / "truncated.bin"
+        truncated.write_bytes(FileHeader().encode()[:HEADER_SIZE - 1])
+        assert FileHeader.probe(truncated) is None
+
     def test_header_validation(self):
         """Header validation catches invalid fields."""
         # Valid header
@@ -168,6 +177,66 @@ class TestStructFormats:
         assert decoded.flags == original.flags
         assert decoded.tx_id == original.tx_id
 
+    @pytest.mark.parametrize("adapter_cls,version", [
+        (SentinelV10Adapter, 0),
+        (SentinelV11Adapter, 1),
+    ])
+    def test_encode_many_matches_encode(self, adapter_cls, version):
+        """Bulk encode produces the same bytes as per-record encode."""
+        traces = [
+            StandardTrace(
+                version=version, record_type=1, core_id=i % 4, seq_no=i,
+                t_ingress=i * 100, t_egress=i * 100 + 5, data=0xDEADBEEF + i,
+                flags=i & 0xFF, tx_id=i,
+            )
+            for i in range(25)
+        ]
+
+        expected = b''.join(adapter_cls.encode(t) for t in traces)
+        assert adapter_cls.encode_many(traces) == expected
+
+    @pytest.mark.parametrize("adapter_cls", [SentinelV10Adapter, SentinelV11Adapter])
+    def test_encode_into_matches_encode(self, adapter_cls):
+        """In-place encode at record offsets matches per-record encode."""
+        size = adapter_cls.SIZE
+        traces = [
+            StandardTrace(
+                version=1, record_type=1, core_id=1, seq_no=i,
+                t_ingress=i * 10, t_egress=i * 10 + 3, data=i,
+                flags=0, tx_id=i,
+            )
+            for i in range(5)
+        ]
+
+        buf = bytearray(b'\xff' * (size * len(traces)))
+        for i, trace in enumerate(traces):
+            adapter_cls.encode_into(trace, buf, i * size)
+
+        assert bytes(buf) == b''.join(adapter_cls.encode(t) for t in traces)
+
+    def test_v11_decode_many_columns(self):
+        """Bulk decode exposes the same fields as per-record decode."""
+        adapter = SentinelV11Adapter()
+        traces = [
+            StandardTrace(
+                version=1, record_type=1, core_id=3, seq_no=i,
+                t_ingress=i * 100, t_egress=i * 100 + 5, data=0xDEADBEEF,
+                flags=0x0100, tx_id=i,
+            )
+            for i in range(10)
+        ]
+        # Trailing partial record is ignored
+        raw = adapter.encode_many(traces) + b'\x00' * 20
+
+        records = adapter.decode_many(raw)
+        assert len(records) == 10
+        assert list(records['seq_no']) == list(range(10))
+        assert list(records['t_egress'] - records['t_ingress']) == [5] * 10
+
+        first = adapter.decode(raw[:48])
+        assert records[0]['core_id'] == first.core_id
+        assert records[0]['data'] == first.data
+
     def test_v10_decode_too_small_raises(self):
         """v1.0 decode with too-small buffer raises ValueError."""
         adapter = SentinelV10Adapter()
@@ -186,18 +255,14 @@ class TestTraceReader:
 
     def _create_v11_records(self, count: int) -> bytes:
         """Create v1.1 format records."""
-        adapter = SentinelV11Adapter()
-        records = []
-
-        for i in range(count):
-            trace = StandardTrace(
+        return SentinelV11Adapter.encode_many([
+            StandardTrace(
                 version=1, record_type=1, core_id=0, seq_no=i,
                 t_ingress=i * 100, t_egress=i * 100 + 5,
                 data=0xDEADBEEF, flags=0, tx_id=i,
             )
-            records.append(adapter.encode(trace))
-
-        return b''.join(records)
+            for i in range(count)
+        ])
 
     def test_header_file_decodes_correctly(self, tmp_path):
         """File with header decodes same records as without."""
@@ -316,6 +381,88 @@ class TestTraceReader:
         with_header_file.write_bytes(header.encode() + record_data)
         assert TraceReader.count(with_header_file) == 49
 
+    def test_read_array_matches_read_path(self, tmp_path):
+        """read_array maps the same records read_path decodes."""
+        header = FileHeader(version=1, record_size=48, record_count=99)
+        test_file = tmp_path / "with_header.bin"
+        test_file.write_bytes(header.encode() + self._create_v11_records(99))
+
+        records = TraceReader.read_array(test_file)
+        traces = list(TraceReader.read_path(test_file))
+
+        assert len(records) == len(traces) == 99
+        assert list(records['seq_no']) == [t.seq_no for t in traces]
+        assert list(records['t_egress']) == [t.t_egress for t in traces]
+
+    @pytest.mark.parametrize("count", [10, 2000], ids=["read", "mmap"])
+    def test_read_small_and_large_files(self, tmp_path, count):
+        """Files below and above MMAP_THRESHOLD decode the same way."""
+        header = FileHeader(version=1, record_size=48, record_count=count)
+        test_file = tmp_path / "traces.bin"
+        test_file.write_bytes(header.encode() + self._create_v11_records(count))
+        assert (test_file.stat().st_size < MMAP_THRESHOLD) == (count == 10)
+
+        traces = list(TraceReader.read_path(test_file))
+        records = TraceReader.read_array(test_file)
+
+        assert [t.seq_no for t in traces] == list(range(count))
+        assert list(records['tx_id']) == list(range(count))
+
+    def test_read_arrays_preserves_path_order(self, tmp_path):
+        """read_arrays yields one array per file, in the order given."""
+        paths = []
+        for n in (5, 17, 1, 33):
+            header = FileHeader(version=1, record_size=48, record_count=n)
+            path = tmp_path / f"traces_{n}.bin"
+            path.write_bytes(header.encode() + self._create_v11_records(n))
+            paths.append(path)
+
+        arrays = list(TraceReader.read_arrays(paths, max_workers=2))
+
+        assert [len(a) for a in arrays] == [5, 17, 1, 33]
+        for path, records in zip(paths, arrays):
+            assert list(records['seq_no']) == list(TraceReader.read_array(path)['seq_no'])
+
+    def test_iter_tx_events_skips_other_record_types(self, tmp_path):
+        """iter_tx_events yields hot fields of TX_EVENT records only."""
+        traces = [
+            StandardTrace(
+                version=1,
+                record_type=RecordType.HEARTBEAT if i % 3 == 0 else RecordType.TX_EVENT,
+                core_id=0, seq_no=i, t_ingress=i * 100, t_egress=i * 100 + 5,
+                data=i, flags=0, tx_id=i,
+            )
+            for i in range(30)
+        ]
+        header = FileHeader(version=1, record_size=48, record_count=len(traces))
+        test_file = tmp_path / "mixed.bin"
+        test_file.write_bytes(header.encode() + SentinelV11Adapter.encode_many(traces))
+
+        expected = [
+            (t.seq_no, t.t_ingress, t.t_egress, t.data)
+            for t in TraceReader.read_path(test_file)
+            if t.record_type == RecordType.TX_EVENT
+        ]
+
+        assert list(TraceReader.iter_tx_events(test_file)) == expected
+        assert len(expected) == 20
+
+    def test_iter_tx_events_csv_fallback(self, tmp_path):
+        """Formats without a record dtype go through per-record decode."""
+        csv_file = tmp_path / "traces.csv"
+        csv_file.write_text("t_ingress,t_egress\n100,105\n200,210\n")
+
+        events = list(TraceReader.iter_tx_events(csv_file))
+        assert [(t_in, t_out) for _, t_in, t_out, _ in events] == [(100, 105), (200, 210)]
+
+    def test_read_array_rejects_csv(self, tmp_path):
+        """read_array needs a fixed-layout binary format."""
+        csv_file = tmp_path / "traces.csv"
+        csv_file.write_text("t_ingress,t_egress\n1,2\n")
+
+        with pytest.raises(ValueError, match="array reads"):
+            TraceReader.read_array(csv_file)
+
     def test_file_not_found_raises(self):
         """Reading non-existent file raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError):
@@ -394,6 +541,11 @@ class TestAutoDetect:
         with pytest.raises(ValueError, match="not found"):
             auto_detect(Path("/nonexistent/file.bin"))
 
+    def test_detect_fails_for_nonexistent_csv(self):
+        """Detection by extension still checks the file exists."""
+        with pytest.raises(ValueError, match="not found"):
+            auto_detect(Path("/nonexistent/file.csv"))
+
 
 class TestStandardTrace:
     """Test StandardTrace dataclass."""
@@ -417,6 +569,17 @@ class TestStandardTrace:
         assert 'latency=5' in repr_str
         assert '0x0100' in repr_str
 
+    def test_uses_slots(self):
+        """Traces carry no per-instance __dict__ and still compare by value."""
+        fields = dict(
+            version=1, record_type=1, core_id=0, seq_no=7,
+            t_ingress=1000, t_egress=1005, data=0, flags=0, tx_id=0,
+        )
+        trace = StandardTrace(**fields)
+
+        assert not hasattr(trace, '__dict__')
+        assert trace == StandardTrace(**fields)
+
 
 class TestAdapterValidation:
     """Test adapter validation."""
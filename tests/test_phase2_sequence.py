@@ -118,6 +118,7 @@ class TestSequenceTrackerBasic:
         assert drop.actual_seq == 5
 
         assert tracker.total_dropped == 2
+        assert not hasattr(drop, '__dict__')
 
     def test_multiple_cores_independent(self):
         """Each core is tracked independently."""
@@ -246,5 +247,82 @@ class TestReset:
         assert tracker.total_resets == 1
 
 
+# (core_ids, seq_nos) streams replayed through check() and check_batch()
+BATCH_STREAMS = [
+    pytest.param([0] * 6, [0xFFFFFFFD, 0xFFFFFFFE, 0xFFFFFFFF, 0, 1, 2], id="clean-wrap"),
+    pytest.param([0] * 2, [0xFFFFFFFE, 2], id="gap-across-wrap"),
+    pytest.param([0] * 5, [0, 1, 3, 2, 4], id="reorder"),
+    pytest.param([0, 0, 1, 1, 0, 1, 0], [0, 1, 0, 1, 2, 5, 2], id="multi-core"),
+    pytest.param([3] * 5, [10, 10, 50, 11, 51], id="duplicate-and-late"),
+]
+
+
+class TestCheckBatch:
+    """check_batch() must match check() trace for trace."""
+
+    @pytest.mark.parametrize("core_ids,seq_nos", BATCH_STREAMS)
+    def test_matches_scalar_check(self, core_ids, seq_nos):
+        """Same events, counters and per-core state as the scalar path."""
+        timestamps = list(range(len(seq_nos)))
+
+        scalar = SequenceTracker()
+        expected = [
+            drop for drop in map(scalar.check, core_ids, seq_nos, timestamps)
+            if drop is not None
+        ]
+
+        batch = SequenceTracker()
+        assert batch.check_batch(core_ids, seq_nos, timestamps) == expected
+        assert batch.drop_events == scalar.drop_events
+        assert batch.reorder_events == scalar.reorder_events
+        assert batch.expected_seq == scalar.expected_seq
+        assert batch.max_seen_seq == scalar.max_seen_seq
+        assert batch.summary() == scalar.summary()
+
+    def test_continues_from_scalar_state(self):
+        """A batch picks up where earlier check() calls left off."""
+        tracker = SequenceTracker()
+        tracker.check(0, 0xFFFFFFFD, 0)
+
+        drops = tracker.check_batch([0, 0], [0xFFFFFFFE, 2], [1, 2])
+
+        assert [d.dropped_count for d in drops] == [3]
+        assert drops[0].event_type == 'wrap'
+        assert tracker.expected_seq[0] == 3
+
+    def test_check_array_from_trace_file(self, tmp_path):
+        """check_array consumes a mapped v1.1 file directly."""
+        from sentinel_hft.adapters import SentinelV11Adapter
+        from sentinel_hft.adapters.base import StandardTrace
+        from sentinel_hft.formats.file_header import FileHeader
+        from sentinel_hft.formats.reader import TraceReader
+
+        seqs = [0, 1, 2, 5, 3, 6]  # 2 dropped (3, 4), then 3 arrives late
+        trace_file = tmp_path / "traces.bin"
+        header = FileHeader(version=1, record_size=48)
+        trace_file.write_bytes(header.encode() + SentinelV11Adapter.encode_many([
+            StandardTrace(
+                version=1, record_type=1, core_id=2, seq_no=seq,
+                t_ingress=i * 10, t_egress=i * 10 + 4, data=0, flags=0, tx_id=i,
+            )
+            for i, seq in enumerate(seqs)
+        ]))
+
+        tracker = SequenceTracker()
+        drops = tracker.check_array(TraceReader.read_array(trace_file))
+
+        assert len(drops) == 1
+        assert drops[0].core_id == 2
+        assert drops[0].dropped_count == 2
+        assert drops[0].timestamp == 34
+        assert tracker.total_reorders == 1
+
+    def test_empty_batch(self):
+        """An empty batch is a no-op."""
+        tracker = SequenceTracker()
+        assert tracker.check_batch([], [], []) == []
+        assert tracker.summary()['cores_tracked'] == 0
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -31,6 +31,38 @@ class TestDDSketch:
         assert 8550 <= p90 <= 9450, f"P90 = {p90}, expected ~9000"
         assert 9405 <= p99 <= 10395, f"P99 = {p99}, expected ~9900"
 
+    def test_add_many_matches_add(self):
+        """Bulk add fills the same buckets as per-value add."""
+        values = [v * 7.3 - 2000 for v in range(5000)] + [0, 0, 0.5]
+
+        scalar = DDSketch(alpha=0.01)
+        for v in values:
+            scalar.add(v)
+
+        bulk = DDSketch(alpha=0.01)
+        bulk.add_many(values)
+
+        assert bulk.positive_buckets == scalar.positive_buckets
+        assert bulk.negative_buckets == scalar.negative_buckets
+        assert bulk.zero_count == scalar.zero_count
+        assert bulk.count() == scalar.count()
+        for p in (0.0, 0.1, 0.5, 0.99, 1.0):
+            assert bulk.percentile(p) == scalar.percentile(p)
+
+    def test_percentile_tracks_updates(self):
+        """Percentiles reflect values added after an earlier query."""
+        sketch = DDSketch(alpha=0.01)
+        sketch.add_many(range(1, 1001))
+        assert 475 <= sketch.percentile(0.50) <= 525
+
+        sketch.add_many(range(100_000, 102_000))
+        assert sketch.percentile(0.50) >= 99_000
+
+        other = DDSketch(alpha=0.01)
+        other.add_many([-5.0] * 10_000)
+        sketch.merge(other)
+        assert sketch.percentile(0.50) < 0
+
     def test_merge(self):
         """Merged sketches produce correct percentiles."""
         s1 = DDSketch(alpha=0.01)
@@ -48,6 +80,18 @@ class TestDDSketch:
         p50 = s1.percentile(0.50)
         assert 4500 <= p50 <= 5500, f"P50 after merge = {p50}"
 
+    @pytest.mark.parametrize("values", [
+        pytest.param([v * 7.3 - 2000 for v in range(5000)] + [0, 0], id="mixed-sign"),
+        pytest.param([42], id="single"),
+        pytest.param([], id="empty"),
+    ])
+    def test_percentiles_matches_percentile(self, values):
+        """Batched lookup agrees with per-percentile lookup, bounds included."""
+        sketch = DDSketch(alpha=0.01)
+        sketch.add_many(values)
+        ps = (-0.5, 0.0, 0.001, 0.5, 0.99, 0.999, 1.0, 2.0)
+        assert sketch.percentiles(ps) == [sketch.percentile(p) for p in ps]
+
     def test_empty_sketch(self):
         """Empty sketch returns 0."""
         sketch = DDSketch()
@@ -86,6 +130,31 @@ class TestTDigestWrapper:
         assert 9405 <= p99 <= 10000, f"P99 = {p99}, expected ~9900"
         assert 9900 <= p999 <= 10100, f"P99.9 = {p999}, expected ~9990"
 
+    def test_add_many_matches_add(self):
+        """Bulk add gives the same estimates and bounds as per-value add."""
+        values = list(range(10001))
+
+        scalar = TDigestWrapper()
+        for v in values:
+            scalar.add(v)
+
+        bulk = TDigestWrapper()
+        bulk.add_many(values)
+
+        assert bulk.count() == scalar.count()
+        assert (bulk.min, bulk.max) == (scalar.min, scalar.max)
+        for p in (0.5, 0.9, 0.99):
+            assert bulk.percentile(p) == pytest.approx(scalar.percentile(p), rel=0.01)
+
+    def test_percentiles_matches_percentile(self):
+        """Batched lookup clamps p like percentile() does."""
+        wrapper = TDigestWrapper()
+        assert wrapper.percentiles((0.5, 0.99)) == [0.0, 0.0]
+
+        wrapper.add_many(range(10001))
+        ps = (0.0, 0.5, 0.9, 0.99, 0.999, 1.0)
+        assert wrapper.percentiles(ps) == [wrapper.percentile(p) for p in ps]
+
     def test_merge_correctness(self):
         """
         CRITICAL TEST: Merge must preserve accuracy.
@@ -173,6 +242,23 @@ class TestRollingWindow:
         # Median of 0-49 is ~24.5
         assert 20 <= p50 <= 30
 
+    def test_percentile_tracks_rotation_and_expiry(self):
+        """Repeated queries stay correct as buckets rotate and expire."""
+        window = RollingWindowStats(
+            window_seconds=3.0,
+            bucket_seconds=1.0,
+            clock_hz=1,
+        )
+
+        for t in range(10):
+            for _ in range(10):
+                window.add(value=100 * (t + 1), timestamp=t)
+            # Max of the window is always the newest bucket's value
+            assert window.percentile(1.0) == pytest.approx(100 * (t + 1), rel=0.02)
+            # Min is the oldest bucket still inside the window
+            oldest = max(0, t - 3)
+            assert window.percentile(0.0) == pytest.approx(100 * (oldest + 1), rel=0.02)
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
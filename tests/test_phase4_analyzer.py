@@ -9,6 +9,7 @@ CRITICAL TESTS:
 import pytest
 from sentinel_hft.streaming.analyzer import StreamingMetrics, StreamingConfig
 from sentinel_hft.adapters.base import StandardTrace
+from sentinel_hft.adapters.sentinel_adapter import SentinelV10Adapter, SentinelV11Adapter
 from sentinel_hft.formats.record_types import RecordType
 
 
@@ -195,5 +196,95 @@ class TestSnapshot:
         assert 'mean_cycles' in lat
 
 
+def make_mixed_stream():
+    """Two cores with gaps, spikes, risk flags and non-TX records mixed in."""
+    traces = []
+    for i in range(240):
+        core = i % 2
+        seq = i // 2 + (5 if core == 1 and i > 100 else 0)  # core 1 gap
+        latency = 500 if i in (80, 150) else 10 + i % 7     # two spikes
+        traces.append(StandardTrace(
+            version=1, record_type=RecordType.TX_EVENT, core_id=core,
+            seq_no=seq, t_ingress=i * 1000, t_egress=i * 1000 + latency,
+            data=0, flags=0x0100 if i % 50 == 0 else 0, tx_id=i & 0xFFFF,
+        ))
+    traces.insert(60, make_trace(seq_no=0, t_egress=59_500,
+                                 record_type=RecordType.HEARTBEAT))
+    traces.insert(120, make_trace(seq_no=0, record_type=RecordType.OVERFLOW,
+                                  data=42))
+    traces.insert(200, make_trace(seq_no=90, record_type=RecordType.RESET))
+    traces[-1].flags = 0x0800
+    return traces
+
+
+class TestAddBatch:
+    """add_batch over record arrays matches per-trace add()."""
+
+    def _per_trace(self, traces):
+        metrics = StreamingMetrics()
+        for trace in traces:
+            metrics.add(trace)
+        return metrics
+
+    @pytest.mark.parametrize("chunk", [None, 1, 37])
+    def test_matches_per_trace_add(self, chunk):
+        """Counters, sequence state and anomalies agree, however it is chunked."""
+        traces = make_mixed_stream()
+        records = SentinelV11Adapter().decode_many(
+            SentinelV11Adapter.encode_many(traces)
+        )
+
+        expected = self._per_trace(traces)
+        batched = StreamingMetrics()
+        step = chunk or len(records)
+        for start in range(0, len(records), step):
+            batched.add_batch(records[start:start + step])
+
+        assert batched.snapshot() == expected.snapshot()
+        assert batched.global_mean == pytest.approx(expected.global_mean)
+        assert batched.global_m2 == pytest.approx(expected.global_m2)
+        assert batched.sequence_tracker.drop_events == expected.sequence_tracker.drop_events
+        assert batched.sequence_tracker.expected_seq == expected.sequence_tracker.expected_seq
+        assert batched.last_timestamp == expected.last_timestamp
+
+        assert len(batched.anomalies) == len(expected.anomalies) > 0
+        for got, want in zip(batched.anomalies, expected.anomalies):
+            assert got[:3] == want[:3]
+            assert got[3] == pytest.approx(want[3])
+
+    def test_risk_flag_counts(self):
+        """Each risk bit is counted per TX_EVENT, including combined flags."""
+        flag_values = [0x0100, 0x0300, 0x0700, 0x0000, 0x0400, 0x0900]
+        traces = [make_trace(seq_no=i, flags=f) for i, f in enumerate(flag_values)]
+        records = SentinelV11Adapter().decode_many(
+            SentinelV11Adapter.encode_many(traces)
+        )
+
+        batched = StreamingMetrics()
+        batched.add_batch(records)
+
+        assert batched.rate_limit_rejects == 4
+        assert batched.position_limit_rejects == 2
+        assert batched.notional_limit_rejects == 2
+        assert batched.kill_switch_triggered
+        assert batched.snapshot()['risk'] == self._per_trace(traces).snapshot()['risk']
+
+    def test_v10_records_count_as_tx_events(self):
+        """v1.0 arrays lack record_type and seq_no; they decode as TX_EVENT, seq 0."""
+        traces = [
+            StandardTrace(
+                version=0, record_type=RecordType.TX_EVENT, core_id=0, seq_no=0,
+                t_ingress=i * 100, t_egress=i * 100 + 10 + i, data=0, flags=0, tx_id=i,
+            )
+            for i in range(20)
+        ]
+        records = SentinelV10Adapter().decode_many(SentinelV10Adapter.encode_many(traces))
+
+        batched = StreamingMetrics()
+        batched.add_batch(records)
+
+        assert batched.snapshot() == self._per_trace(traces).snapshot()
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -8,11 +8,16 @@ Tests verify:
 """
 
 import pytest
+import socket
 import struct
+import threading
+import time
 import zlib
+from sentinel_hft.collectors import SPSCRing, udp_collector
 from sentinel_hft.collectors.udp_collector import UDPPacketHeader, UDPCollector
 from sentinel_hft.adapters.sentinel_adapter import SentinelV11Adapter
 from sentinel_hft.adapters.base import StandardTrace
+from sentinel_hft.streaming.analyzer import StreamingMetrics
 
 
 class TestUDPHeader:
@@ -143,6 +148,146 @@ class TestUDPCollector:
         assert 'traces_received' in stats
         assert 'drops' in stats
 
+    def test_handle_packet_delivers_traces(self):
+        """A valid packet is CRC-checked and its traces delivered."""
+        received = []
+        collector = UDPCollector(on_traces=received.extend)
+
+        payload = SentinelV11Adapter.encode_many([
+            StandardTrace(
+                version=1, record_type=1, core_id=0, seq_no=i,
+                t_ingress=i * 100, t_egress=i * 100 + 10,
+                data=0xCAFE, flags=0, tx_id=i,
+            )
+            for i in range(3)
+        ])
+        header = UDPPacketHeader(
+            magic=UDPPacketHeader.MAGIC,
+            version=1, core_id=0, seq_start=0, seq_end=2,
+            record_count=3, reserved=0, crc32=UDPPacketHeader.compute_crc(payload),
+        )
+
+        collector._handle_packet(header.encode() + payload)
+        assert [t.seq_no for t in received] == [0, 1, 2]
+        assert collector.traces_received == 3
+
+        # Flip one payload byte: CRC must reject the packet
+        corrupt = bytearray(header.encode() + payload)
+        corrupt[-1] ^= 0xFF
+        collector._handle_packet(bytes(corrupt))
+        assert collector.packets_crc_failed == 1
+        assert collector.traces_received == 3
+
+    def test_handle_packet_delivers_record_arrays(self):
+        """on_records gets a structured array that add_batch can consume."""
+        metrics = StreamingMetrics()
+        collector = UDPCollector(on_records=metrics.add_batch)
+
+        payload = SentinelV11Adapter.encode_many([
+            StandardTrace(
+                version=1, record_type=1, core_id=0, seq_no=i,
+                t_ingress=i * 100, t_egress=i * 100 + 10 + i,
+                data=0, flags=0, tx_id=i,
+            )
+            for i in range(4)
+        ])
+        header = UDPPacketHeader(
+            magic=UDPPacketHeader.MAGIC,
+            version=1, core_id=0, seq_start=0, seq_end=3,
+            record_count=4, reserved=0, crc32=UDPPacketHeader.compute_crc(payload),
+        )
+
+        collector._handle_packet(header.encode() + payload)
+
+        assert collector.traces_received == 4
+        assert metrics.global_count == 4
+        assert metrics.global_mean == 11.5
+
+    @pytest.mark.skipif(udp_collector._libc is None, reason="recvmmsg unavailable")
+    @pytest.mark.parametrize("n_packets", [1, 5, udp_collector.RECV_BATCH + 3])
+    def test_drain_handles_queued_packets(self, n_packets):
+        """Backlogged datagrams are drained in recvmmsg batches, in order."""
+        received = []
+        collector = UDPCollector(on_traces=received.extend)
+        collector.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        collector.socket.bind(('127.0.0.1', 0))
+        collector._batch = udp_collector._BatchReceiver()
+        sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+        try:
+            for i in range(n_packets):
+                payload = SentinelV11Adapter.encode_many([
+                    StandardTrace(
+                        version=1, record_type=1, core_id=0, seq_no=i,
+                        t_ingress=i, t_egress=i + 5, data=0, flags=0, tx_id=i,
+                    )
+                ])
+                header = UDPPacketHeader(
+                    magic=UDPPacketHeader.MAGIC,
+                    version=1, core_id=0, seq_start=i, seq_end=i,
+                    record_count=1, reserved=0,
+                    crc32=UDPPacketHeader.compute_crc(payload),
+                )
+                sender.sendto(header.encode() + payload,
+                              collector.socket.getsockname())
+
+            collector._drain()
+        finally:
+            sender.close()
+            collector.socket.close()
+
+        assert collector.packets_received == n_packets
+        assert [t.seq_no for t in received] == list(range(n_packets))
+
+
+class TestSPSCRing:
+    """Test the collector -> analyzer handoff ring."""
+
+    @pytest.mark.parametrize("requested,capacity", [(1, 1), (5, 8), (4096, 4096)])
+    def test_capacity_rounds_to_power_of_two(self, requested, capacity):
+        assert SPSCRing(requested).capacity == capacity
+
+    def test_full_ring_rejects_and_counts_drops(self):
+        ring = SPSCRing(4)
+        assert all(ring.offer(i) for i in range(4))
+        assert not ring.offer(4)
+        assert ring.dropped == 1
+
+        assert ring.poll() == 0
+        assert ring.offer(5)
+        assert ring.drain() == [1, 2, 3, 5]
+        assert ring.poll() is None
+        assert len(ring) == 0
+
+    def test_drain_max_items_wraps(self):
+        ring = SPSCRing(4)
+        for i in range(3):
+            ring.offer(i)
+        assert ring.drain(2) == [0, 1]
+        for i in range(3, 6):
+            ring.offer(i)
+        assert ring.drain() == [2, 3, 4, 5]
+
+    def test_threaded_handoff_preserves_order(self):
+        """One producer thread, one consumer thread, nothing lost or reordered."""
+        ring = SPSCRing(64)
+        n = 5000
+
+        def produce():
+            for i in range(n):
+                while not ring.offer(i):
+                    time.sleep(0)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        received = []
+        while len(received) < n:
+            received.extend(ring.drain())
+            time.sleep(0)
+        producer.join()
+
+        assert received == list(range(n))
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -9,6 +9,7 @@ CRITICAL TESTS:
 
 import os
 import pytest
+import yaml
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 
@@ -20,6 +21,8 @@ from sentinel_hft.config import (
     load_config,
     generate_default_config,
 )
+from sentinel_hft.config import schema
+from sentinel_hft.config.schema import _substitute_env_vars
 
 
 class TestClockConfig:
@@ -176,6 +179,22 @@ exporters:
         # Original ${VAR} syntax is preserved
         assert '${NONEXISTENT_VAR_12345}' in config.exporters.slack.webhook
 
+    @pytest.mark.parametrize("text,expected", [
+        ("plain", "plain"),
+        ("${SENTINEL_TEST_HOST}:${SENTINEL_TEST_PORT}", "db:5432"),
+        ("pre-${SENTINEL_TEST_HOST}-post", "pre-db-post"),
+        ("$${SENTINEL_TEST_HOST}", "$db"),
+        ("${}${SENTINEL_TEST_HOST}", "${}db"),
+        ("${SENTINEL_TEST_HOST", "${SENTINEL_TEST_HOST"),
+        ("${NONEXISTENT_VAR_12345}/${SENTINEL_TEST_PORT}", "${NONEXISTENT_VAR_12345}/5432"),
+    ])
+    def test_substitution_edge_cases(self, monkeypatch, text, expected):
+        """Adjacent, empty, unterminated and missing references."""
+        monkeypatch.setenv('SENTINEL_TEST_HOST', 'db')
+        monkeypatch.setenv('SENTINEL_TEST_PORT', '5432')
+
+        assert _substitute_env_vars(text) == expected
+
 
 class TestSecretRedaction:
     """Test secret redaction for logging."""
@@ -195,12 +214,35 @@ class TestSecretRedaction:
         # Redacted version
         assert redacted.exporters.slack.webhook == '***REDACTED***'
 
+    @pytest.mark.parametrize("webhook", ['https://hooks.slack.com/secret123', None])
+    def test_redaction_keeps_other_fields(self, webhook):
+        """Only the secret differs between a config and its redacted copy."""
+        config = SentinelConfig.from_dict({
+            'clock': {'frequency_mhz': 250},
+            'exporters': {'slack': {'enabled': True, 'webhook': webhook}},
+        })
+
+        redacted = config.redacted()
+
+        assert redacted is not config
+        expected = config.to_dict()
+        if webhook:
+            expected['exporters']['slack']['webhook'] = '***REDACTED***'
+        assert redacted.to_dict() == expected
+
 
 class TestFileLoading:
     """Test YAML file loading."""
 
-    def test_load_from_file(self):
-        """Config loads from YAML file."""
+    @pytest.mark.parametrize("loader", [
+        pytest.param(getattr(yaml, 'CSafeLoader', None), id="libyaml"),
+        pytest.param(yaml.SafeLoader, id="pure-python"),
+    ])
+    def test_load_from_file(self, monkeypatch, loader):
+        """Config loads from YAML file with either YAML loader."""
+        if loader is None:
+            pytest.skip("PyYAML built without libyaml")
+        monkeypatch.setattr(schema, '_YamlLoader', loader)
         yaml_content = """
 version: 1
 clock:
@@ -150,8 +150,42 @@ class TestEvidenceBundle:
         json_size = len(bundle.to_json().encode())
         assert len(compressed) < json_size
 
-    def test_evidence_base64_roundtrip(self):
-        """Evidence survives base64 encoding."""
+    @pytest.mark.parametrize("use_zstd", [True, False], ids=["zstd", "gzip"])
+    def test_evidence_codecs_roundtrip(self, monkeypatch, use_zstd):
+        """Bundles written with either codec are read back by frame magic."""
+        from sentinel_hft.core import evidence
+
+        if use_zstd and evidence._zstd is None:
+            pytest.skip("zstandard not installed")
+        monkeypatch.setattr(evidence, "_USE_ZSTD", use_zstd)
+
+        bundle = EvidenceBundle(source_file='test.bin')
+        bundle.add_drop(DropEvidence(0, 0, 50, 55, 5, 'gap'))
+
+        compressed = bundle.to_compressed()
+        assert (compressed[:4] == evidence.ZSTD_MAGIC) == use_zstd
+
+        restored = EvidenceBundle.from_compressed(compressed)
+        assert restored.to_dict() == bundle.to_dict()
+
+    def test_evidence_zstd_without_zstandard(self, monkeypatch):
+        """A zstd bundle read without zstandard fails with an install hint."""
+        from sentinel_hft.core import evidence
+
+        monkeypatch.setattr(evidence, "_zstd", None)
+
+        with pytest.raises(ValueError, match=r"sentinel-hft\[zstd\]"):
+            EvidenceBundle.from_compressed(evidence.ZSTD_MAGIC + b'\x00' * 8)
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_evidence_base64_roundtrip(self, monkeypatch, use_orjson):
+        """Evidence survives base64 encoding with either JSON backend."""
+        from sentinel_hft.core import jsonio
+
+        if use_orjson and jsonio._orjson is None:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(jsonio, "_USE_ORJSON", use_orjson)
+
         bundle = EvidenceBundle(source_file='test.bin')
         bundle.add_anomaly(AnomalyEvidence(0, 42, 0, 500, 4.2, 0.99))
 
@@ -208,6 +242,23 @@ class TestAnalysisReport:
         assert restored.latency.p99_cycles == 45
         assert restored.drops.total_drops == 100
 
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_json_backends_agree(self, monkeypatch, use_orjson):
+        """Report JSON is identical in content with and without orjson."""
+        from sentinel_hft.core import jsonio
+
+        if use_orjson and jsonio._orjson is None:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(jsonio, "_USE_ORJSON", use_orjson)
+
+        report = AnalysisReport()
+        report.latency.count = 1000
+        report.latency.p99_cycles = 45
+        report.latency.mean_cycles = 12.5
+
+        assert json.loads(report.to_json()) == report.to_dict()
+        assert json.loads(report.to_json(indent=4)) == report.to_dict()
+
     def test_status_computation(self):
         """
         CRITICAL TEST: Status computed correctly from thresholds.